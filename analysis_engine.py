@@ -6,49 +6,83 @@
 
 import os
 import re
+import html
 import time
 import tempfile
 import datetime
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    import json
+    _json_loads = json.loads
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from matplotlib import font_manager
+from matplotlib import dates as mdates
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 
 import config
 
 
 # ── 한글 폰트 설정 ──────────────────────────────────────
 
+# 한글 폰트 후보 경로 (우선순위 순)
+_FONT_PATHS = [
+    # 프로젝트 내 번들 폰트
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 "fonts", "AppleSDGothicNeo.ttc"),
+    # macOS
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/Library/Fonts/AppleGothic.ttf",
+    # Ubuntu / Debian
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    # CentOS / RHEL
+    "/usr/share/fonts/nanum/NanumGothic.ttf",
+    # Windows
+    "C:/Windows/Fonts/malgun.ttf",
+]
+
+
+def _find_korean_font() -> Optional[str]:
+    """OS별 한글 폰트 경로를 우선순위 순으로 탐색
+
+    Returns:
+        폰트 파일 경로, 못 찾으면 None
+    """
+    for path in _FONT_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
 def _setup_korean_font():
     """OS별 한글 폰트를 탐색하여 matplotlib에 설정"""
-    # 프로젝트 내 번들 폰트 경로
-    _project_font = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "fonts", "AppleSDGothicNeo.ttc")
-    font_paths = [
-        _project_font,
-        # macOS
-        "/System/Library/Fonts/AppleSDGothicNeo.ttc",
-        "/Library/Fonts/AppleGothic.ttf",
-        # Ubuntu / Debian
-        "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        # CentOS / RHEL
-        "/usr/share/fonts/nanum/NanumGothic.ttf",
-        # Windows
-        "C:/Windows/Fonts/malgun.ttf",
-    ]
-    for path in font_paths:
-        if os.path.exists(path):
-            font_manager.fontManager.addfont(path)
-            prop = font_manager.FontProperties(fname=path)
-            plt.rcParams["font.family"] = prop.get_name()
-            plt.rcParams["axes.unicode_minus"] = False
-            return
-    # 폰트를 못 찾으면 기본 설정 유지
     plt.rcParams["axes.unicode_minus"] = False
+    path = _find_korean_font()
+    if path is None:
+        # 폰트를 못 찾으면 기본 설정 유지
+        return
+    name = font_manager.FontProperties(fname=path).get_name()
+    if name in plt.rcParams["font.family"]:
+        return
+    font_manager.fontManager.addfont(path)
+    plt.rcParams["font.family"] = name
 
 
 _setup_korean_font()
@@ -56,6 +90,9 @@ _setup_korean_font()
 
 # ── A. 분봉 OHLCV 데이터 수집 ──────────────────────────────
 
+OHLCV_COLUMNS = ["datetime", "open", "high", "low", "close", "volume"]
+
+
 def fetch_minute_ohlcv(client, stock_code: str,
                        minute_interval: str = None,
                        num_candles: int = None) -> pd.DataFrame:
@@ -68,8 +105,9 @@ def fetch_minute_ohlcv(client, stock_code: str,
         num_candles: 수집할 캔들 수 (기본: config.MINUTE_CANDLES)
 
     Returns:
-        DataFrame(datetime, open, high, low, close, volume), 오래된 순 정렬.
-        실패 시 빈 DataFrame.
+        DataFrame(datetime, open, high, low, close, volume, time_dt),
+        오래된 순 정렬. datetime은 HHMMSS 문자열, time_dt는 오늘 날짜 기준
+        datetime64. 실패 시 빈 DataFrame.
     """
     if minute_interval is None:
         minute_interval = config.MINUTE_INTERVAL
@@ -89,33 +127,57 @@ def fetch_minute_ohlcv(client, stock_code: str,
     if not records:
         return pd.DataFrame()
 
-    df = pd.DataFrame(records)
-    df = df.rename(columns={
-        "stck_cntg_hour": "datetime",
-        "stck_oprc": "open",
-        "stck_hgpr": "high",
-        "stck_lwpr": "low",
-        "stck_prpr": "close",
-        "cntg_vol": "volume",
-    })
-
-    # 숫자 변환
-    for col in ["open", "high", "low", "close", "volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # 중복 제거(첫 값 유지)·정렬·자르기를 DataFrame 생성 전에 끝내고
+    # 필요한 행만 한 번에 DataFrame으로 만듦
+    by_time = {}
+    for r in records:
+        by_time.setdefault(r["stck_cntg_hour"], r)
+    rows = [
+        (hour, r["stck_oprc"], r["stck_hgpr"], r["stck_lwpr"],
+         r["stck_prpr"], r["cntg_vol"])
+        for hour, r in sorted(by_time.items())[-num_candles:]
+    ]
+    df = pd.DataFrame.from_records(rows, columns=OHLCV_COLUMNS)
 
-    # 중복 제거 후 오래된 순 정렬
-    df = df.drop_duplicates(subset="datetime")
-    df = df.sort_values("datetime").reset_index(drop=True)
+    # 숫자 변환 (비정상 값이 섞인 경우에만 컬럼별 coerce)
+    num_cols = OHLCV_COLUMNS[1:]
+    try:
+        df[num_cols] = df[num_cols].astype(np.float64)
+    except ValueError:
+        for col in num_cols:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
 
-    # 필요한 캔들 수만큼 자르기
-    if len(df) > num_candles:
-        df = df.tail(num_candles).reset_index(drop=True)
+    # 차트 x축용 시각을 한 번만 파싱 (datetime 문자열은 신호 시각 비교용으로 유지)
+    today_str = datetime.date.today().strftime("%Y%m%d")
+    df["time_dt"] = pd.to_datetime(
+        today_str + df["datetime"], format="%Y%m%d%H%M%S", cache=True)
 
     return df
 
 
 # ── B. 골든크로스 신호 판단 ─────────────────────────────────
 
+def _moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """단순 이동평균을 계산 (pandas rolling(window).mean()과 동일한 결과)
+
+    윈도우 합을 한 번의 convolve로 구하므로 rolling 객체 생성 없이 계산됩니다.
+    NaN이 포함된 윈도우는 NaN, 앞쪽 window-1개 구간도 NaN으로 채웁니다.
+
+    Args:
+        values: 종가 배열
+        window: 이동평균 기간
+
+    Returns:
+        values와 길이가 같은 float64 배열
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if values.size >= window:
+        out[window - 1:] = np.convolve(
+            values, np.ones(window), mode="valid") / window
+    return out
+
+
 def check_golden_cross(df: pd.DataFrame) -> dict:
     """MA3/MA5 골든크로스 신호를 판단
 
@@ -140,29 +202,29 @@ def check_golden_cross(df: pd.DataFrame) -> dict:
         result["reason"] = "데이터 부족 (최소 6개 캔들 필요)"
         return result
 
-    df = df.copy()
-    df["ma3"] = df["close"].rolling(window=3).mean()
-    df["ma5"] = df["close"].rolling(window=5).mean()
-
-    latest = df.iloc[-1]
-    prev = df.iloc[-2]
+    # 마지막 두 캔들의 MA만 필요하므로 전체 rolling 대신 꼬리 6개로 직접 계산
+    close = df["close"].to_numpy(dtype=np.float64)
+    ma3_curr = close[-3:].mean()
+    ma3_prev = close[-4:-1].mean()
+    ma5_curr = close[-5:].mean()
+    ma5_prev = close[-6:-1].mean()
 
-    result["datetime"] = latest["datetime"]
-    result["close"] = float(latest["close"])
-    result["ma3"] = round(float(latest["ma3"]), 2) if pd.notna(latest["ma3"]) else None
-    result["ma5"] = round(float(latest["ma5"]), 2) if pd.notna(latest["ma5"]) else None
+    result["datetime"] = df["datetime"].iat[-1]
+    result["close"] = float(close[-1])
+    result["ma3"] = round(float(ma3_curr), 2) if not np.isnan(ma3_curr) else None
+    result["ma5"] = round(float(ma5_curr), 2) if not np.isnan(ma5_curr) else None
 
-    if pd.isna(latest["ma3"]) or pd.isna(latest["ma5"]):
+    if np.isnan(ma3_curr) or np.isnan(ma5_curr):
         result["reason"] = "이동평균 계산 불가"
         return result
 
-    if pd.isna(prev["ma3"]) or pd.isna(prev["ma5"]):
+    if np.isnan(ma3_prev) or np.isnan(ma5_prev):
         result["reason"] = "이전 캔들 이동평균 계산 불가"
         return result
 
     # 골든크로스: 이전 MA3 <= MA5, 현재 MA3 > MA5
-    prev_below = prev["ma3"] <= prev["ma5"]
-    curr_above = latest["ma3"] > latest["ma5"]
+    prev_below = ma3_prev <= ma5_prev
+    curr_above = ma3_curr > ma5_curr
 
     if prev_below and curr_above:
         result["signal"] = True
@@ -178,9 +240,29 @@ def check_golden_cross(df: pd.DataFrame) -> dict:
 
 # ── C. 네이버 뉴스 검색 ─────────────────────────────────
 
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news.json"
+
+# keep-alive 세션 재사용 — 요청마다 TCP/TLS 핸드셰이크를 반복하지 않음
+_NAVER_SESSION = requests.Session()
+_NAVER_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)))
+_NAVER_SESSION.headers.update({
+    "X-Naver-Client-Id": config.NAVER_CLIENT_ID,
+    "X-Naver-Client-Secret": config.NAVER_CLIENT_SECRET,
+})
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 def _strip_html(text: str) -> str:
-    """HTML 태그를 제거하는 헬퍼"""
-    return re.sub(r"<[^>]+>", "", text)
+    """HTML 태그를 제거하고 엔티티(&quot; 등)를 디코딩하는 헬퍼"""
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text
 
 
 def fetch_naver_news(stock_name: str, display: int = 3) -> list[dict]:
@@ -197,11 +279,6 @@ def fetch_naver_news(stock_name: str, display: int = 3) -> list[dict]:
     if not config.NAVER_CLIENT_ID or not config.NAVER_CLIENT_SECRET:
         return []
 
-    url = "https://openapi.naver.com/v1/search/news.json"
-    headers = {
-        "X-Naver-Client-Id": config.NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": config.NAVER_CLIENT_SECRET,
-    }
     params = {
         "query": stock_name,
         "display": display,
@@ -209,12 +286,13 @@ def fetch_naver_news(stock_name: str, display: int = 3) -> list[dict]:
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params,
-                                timeout=5)
+        response = _NAVER_SESSION.get(NAVER_NEWS_URL, params=params,
+                                      timeout=5)
         if response.status_code != 200:
             return []
 
-        data = response.json()
+        # response.json()의 인코딩 추정을 건너뛰고 바이트를 바로 파싱
+        data = _json_loads(response.content)
         items = data.get("items", [])
 
         result = []
@@ -231,8 +309,113 @@ def fetch_naver_news(stock_name: str, display: int = 3) -> list[dict]:
         return []
 
 
+def fetch_naver_news_batch(stock_names: list[str], display: int = 3,
+                           max_workers: int = 8) -> dict:
+    """여러 종목의 뉴스를 동시에 검색
+
+    종목별 요청을 스레드 풀에서 병렬 실행하므로 전체 소요 시간이
+    요청 수의 합이 아니라 가장 느린 요청 수준으로 줄어듭니다.
+
+    Args:
+        stock_names: 검색할 종목명 리스트
+        display: 종목당 반환할 뉴스 수 (기본 3건)
+        max_workers: 동시 요청 수 상한
+
+    Returns:
+        {종목명: [{"title", "description", "link", "pubDate"}, ...]}
+    """
+    names = list(dict.fromkeys(stock_names))
+    if not names:
+        return {}
+
+    with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(names))) as executor:
+        results = executor.map(
+            lambda name: fetch_naver_news(name, display), names)
+        return dict(zip(names, results))
+
+
 # ── D. 신호 차트 생성 ───────────────────────────────────
 
+# 선 하나에 그릴 최대 포인트 수 (초과 시 LTTB 다운샘플링)
+_CHART_MAX_POINTS = 400
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """LTTB(Largest-Triangle-Three-Buckets)로 남길 포인트 인덱스를 선택
+
+    첫/마지막 포인트는 유지하고, 나머지 구간을 n_out-2개 버킷으로 나눠
+    이전 선택점·다음 버킷 평균과 이루는 삼각형 넓이가 가장 큰 점을 고릅니다.
+
+    Args:
+        x: x 좌표 (숫자 배열)
+        y: y 좌표 (x와 같은 길이, NaN 없음)
+        n_out: 출력 포인트 수
+
+    Returns:
+        선택된 인덱스 배열 (오름차순)
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (n_out - 2)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(max(int((i + 2) * every) + 1, end + 1), n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                       - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        selected[i + 1] = a
+    return selected
+
+
+# 차트 Figure/Axes는 한 번 만들어 재사용 (스레드에서 호출되므로 lock으로 보호)
+_chart_lock = threading.Lock()
+_chart_fig = None
+_chart_ax = None
+
+
+def _get_chart_axes():
+    """재사용할 차트 Figure/Axes를 반환 (최초 호출 시 생성, 이후 cla로 초기화)"""
+    global _chart_fig, _chart_ax
+    if _chart_fig is None:
+        plt.style.use("dark_background")
+        _chart_fig, _chart_ax = plt.subplots(figsize=(12, 6))
+    else:
+        _chart_ax.cla()
+    return _chart_fig, _chart_ax
+
+
+# 차트 선 스타일: (컬럼, 범례, 색상, 선 굵기, 투명도)
+_CHART_LINES = [
+    ("close", "종가", "white", 1.5, 1.0),
+    ("ma3", "MA3", "red", 1.0, 0.8),
+    ("ma5", "MA5", "dodgerblue", 1.0, 0.8),
+]
+
+
+def _line_vertices(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """NaN 구간을 제외하고, 포인트가 많으면 LTTB로 줄인 (N, 2) 꼭짓점 배열"""
+    mask = ~np.isnan(y)
+    x, y = x[mask], y[mask]
+    if len(y) > _CHART_MAX_POINTS:
+        idx = _lttb_indices(x, y, _CHART_MAX_POINTS)
+        x, y = x[idx], y[idx]
+    return np.column_stack([x, y])
+
+
 def generate_signal_chart(df: pd.DataFrame, stock_name: str,
                           signal_datetime: str = None) -> str:
     """종가 + MA3/MA5 이동평균선 차트를 생성하여 PNG 파일로 저장
@@ -249,52 +432,127 @@ def generate_signal_chart(df: pd.DataFrame, stock_name: str,
         df = df.copy()
 
         # 이동평균 계산
-        df["ma3"] = df["close"].rolling(window=3).mean()
-        df["ma5"] = df["close"].rolling(window=5).mean()
-
-        # x축용 시간 변환 (HHMMSS → datetime)
-        today_str = datetime.date.today().strftime("%Y%m%d")
-        df["time_dt"] = pd.to_datetime(
-            today_str + df["datetime"], format="%Y%m%d%H%M%S")
-
-        plt.style.use("dark_background")
-        fig, ax = plt.subplots(figsize=(12, 6))
-
-        # 종가
-        ax.plot(df["time_dt"], df["close"],
-                color="white", linewidth=1.5, label="종가")
-
-        # 이동평균선
-        ax.plot(df["time_dt"], df["ma3"],
-                color="red", linewidth=1, alpha=0.8, label="MA3")
-        ax.plot(df["time_dt"], df["ma5"],
-                color="dodgerblue", linewidth=1, alpha=0.8, label="MA5")
-
-        # 골든크로스 마커
-        if signal_datetime:
-            signal_rows = df[df["datetime"] == signal_datetime]
-            if not signal_rows.empty:
-                sig_row = signal_rows.iloc[0]
-                ax.scatter(sig_row["time_dt"], sig_row["close"],
-                           color="red", marker="^", s=200, zorder=5,
-                           label="골든크로스")
-
-        ax.set_title(f"{stock_name} - 30분봉 골든크로스 분석", fontsize=14)
-        ax.set_xlabel("시간")
-        ax.set_ylabel("가격 (원)")
-        ax.legend(loc="upper left", fontsize=9)
-        ax.grid(True, alpha=0.3)
-
-        fig.autofmt_xdate()
-        fig.tight_layout()
-
-        # tempfile로 PNG 저장
-        fd, path = tempfile.mkstemp(suffix=".png", prefix="signal_chart_")
-        os.close(fd)
-        fig.savefig(path, dpi=150, bbox_inches="tight")
-        plt.close(fig)
+        close = df["close"].to_numpy(dtype=np.float64)
+        df["ma3"] = _moving_average(close, 3)
+        df["ma5"] = _moving_average(close, 5)
+
+        # x축용 시간 (fetch_minute_ohlcv에서 파싱된 값이 없을 때만 변환)
+        if "time_dt" not in df.columns:
+            today_str = datetime.date.today().strftime("%Y%m%d")
+            df["time_dt"] = pd.to_datetime(
+                today_str + df["datetime"], format="%Y%m%d%H%M%S")
+
+        with _chart_lock:
+            fig, ax = _get_chart_axes()
+
+            # 종가 + 이동평균선을 x좌표를 공유하는 LineCollection 하나로 그림
+            x = mdates.date2num(df["time_dt"])
+            lc = LineCollection(
+                [_line_vertices(x, df[col].to_numpy(dtype=np.float64))
+                 for col, *_ in _CHART_LINES],
+                colors=[to_rgba(color, alpha)
+                        for _, _, color, _, alpha in _CHART_LINES],
+                linewidths=[lw for *_, lw, _ in _CHART_LINES],
+            )
+            ax.add_collection(lc)
+            ax.xaxis_date()
+            ax.autoscale_view()
+
+            # 범례는 Line2D 프록시로 구성
+            handles = [
+                Line2D([], [], color=color, linewidth=lw, alpha=alpha,
+                       label=label)
+                for _, label, color, lw, alpha in _CHART_LINES
+            ]
+
+            # 골든크로스 마커 (다운샘플링과 무관하게 원본 해상도 기준)
+            if signal_datetime:
+                signal_rows = df[df["datetime"] == signal_datetime]
+                if not signal_rows.empty:
+                    sig_row = signal_rows.iloc[0]
+                    handles.append(ax.scatter(
+                        mdates.date2num(sig_row["time_dt"]), sig_row["close"],
+                        color="red", marker="^", s=200, zorder=5,
+                        label="골든크로스"))
+
+            ax.set_title(f"{stock_name} - 30분봉 골든크로스 분석",
+                         fontsize=14)
+            ax.set_xlabel("시간")
+            ax.set_ylabel("가격 (원)")
+            ax.legend(handles=handles, loc="upper left", fontsize=9)
+            ax.grid(True, alpha=0.3)
+
+            fig.autofmt_xdate()
+            fig.tight_layout()
+
+            # tempfile로 PNG 저장
+            fd, path = tempfile.mkstemp(suffix=".png",
+                                        prefix="signal_chart_")
+            os.close(fd)
+            # tight_layout이 이미 적용되어 있으므로 bbox_inches="tight"의
+            # 추가 렌더링 패스는 생략
+            fig.savefig(path, dpi=150)
 
         return path
     except Exception as e:
         print(f"[차트 생성 오류] {stock_name}: {e}")
         return ""
+
+
+def _render_one(job: tuple) -> str:
+    """프로세스 풀 작업 단위 — (df, 종목명, 신호시각) 튜플로 차트 생성"""
+    df, stock_name, signal_datetime = job
+    return generate_signal_chart(df, stock_name, signal_datetime)
+
+
+def create_chart_pool(max_workers: int = None) -> ProcessPoolExecutor:
+    """render_charts_batch()에 재사용할 차트 전용 프로세스 풀 생성
+
+    워커는 spawn 방식으로 띄워 봇 프로세스의 스레드/락 상태를 물려받지 않으며,
+    첫 작업 때 한 번만 matplotlib을 import하고 이후 호출에서는 그대로 재사용됩니다.
+
+    Args:
+        max_workers: 워커 프로세스 수 (기본: CPU 코어 수)
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"))
+
+
+def render_charts_batch(jobs: list[tuple], max_workers: int = None,
+                        executor: ProcessPoolExecutor = None) -> list[str]:
+    """여러 종목의 신호 차트를 프로세스 풀에서 병렬 생성
+
+    차트 렌더링은 종목별로 독립적인 CPU 작업이므로 프로세스로 나눠
+    GIL 없이 병렬 처리합니다. executor(create_chart_pool())를 넘기면 그 풀을
+    재사용하고, 없으면 호출마다 풀을 만들되 작업이 1개면 풀 없이 바로 그립니다.
+
+    Args:
+        jobs: [(df, 종목명, 신호시각), ...]
+        max_workers: 풀을 새로 만들 때의 워커 프로세스 수 (기본: CPU 코어 수)
+        executor: 재사용할 프로세스 풀 (기본: 호출마다 생성)
+
+    Returns:
+        jobs와 같은 순서의 PNG 파일 경로 리스트 (실패한 항목은 빈 문자열)
+
+    Raises:
+        BrokenProcessPool: 넘겨받은 executor의 워커가 비정상 종료되어 풀을 더
+            쓸 수 없을 때 (풀을 가진 호출부가 새 풀로 교체하도록 그대로 전달)
+    """
+    if not jobs:
+        return []
+    try:
+        if executor is not None:
+            return list(executor.map(_render_one, jobs))
+        if len(jobs) == 1:
+            return [_render_one(jobs[0])]
+
+        workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with create_chart_pool(workers) as pool:
+            return list(pool.map(_render_one, jobs, chunksize=chunksize))
+    except Exception as e:
+        if executor is not None and isinstance(e, BrokenProcessPool):
+            raise
+        print(f"[차트 일괄 생성 오류] {e}")
+        return [""] * len(jobs)
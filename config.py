@@ -12,8 +12,9 @@ DISCORD_BOT_TOKEN = os.environ.get("DISCORD_BOT_TOKEN", "")
 DISCORD_CHANNEL_ID = os.environ.get("DISCORD_CHANNEL_ID", "")  # 자동 스캔 결과 채널
 
 _discord_allowed_raw = os.environ.get("DISCORD_ALLOWED_USERS", "")
-DISCORD_ALLOWED_USERS = set(
-    int(x.strip()) for x in _discord_allowed_raw.split(",") if x.strip()
+# 변경되지 않는 값이므로 frozenset으로 보관
+DISCORD_ALLOWED_USERS = frozenset(
+    map(int, filter(None, map(str.strip, _discord_allowed_raw.split(","))))
 )
 
 # Naver Search API
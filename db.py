@@ -5,11 +5,91 @@ SQLite 데이터베이스 관리 모듈
 """
 
 import os
+import json
+import asyncio
 import sqlite3
 import datetime
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+
+import pandas as pd
 
 import config
 
+# INSERT ... RETURNING은 SQLite 3.35부터 지원
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# daily_prices INSERT 컬럼 순서
+DAILY_PRICE_COLUMNS = ["날짜", "종목코드", "종목명", "시장",
+                       "시가", "고가", "저가", "종가", "거래량"]
+
+
+# 기간 내 종목별 첫날/마지막날 종가와 수익률 조회 SQL
+# 종목마다 daily_close의 (종목코드, 날짜) PK를 범위 탐색하여 첫날·마지막날 종가만
+# 읽으므로 기간 길이와 무관하게 종목당 인덱스 탐색 몇 번으로 끝남.
+# 종목명/시장은 stock_meta에서 가져오며 거래일이 2일 미만이거나 시작가가 0인
+# 종목은 제외. 컬럼 별칭이 반환 dict의 키가 되므로 dict(row)만으로 결과가 완성됨.
+# py_round는 Python round()와 같은 반올림을 위해 연결에 등록한 함수.
+_PERIOD_RETURNS_SQL = """
+    SELECT 종목코드, 종목명, 시장, 시작가, 종료가,
+           py_round((종료가 - 시작가) * 1.0 / 시작가 * 100, 2) AS "수익률(%)"
+    FROM (
+        SELECT m.종목코드, m.종목명, m.시장,
+               (SELECT 종가 FROM daily_close c
+                WHERE c.종목코드 = m.종목코드
+                  AND c.날짜 BETWEEN :start AND :end
+                ORDER BY c.날짜 LIMIT 1) AS 시작가,
+               (SELECT 종가 FROM daily_close c
+                WHERE c.종목코드 = m.종목코드
+                  AND c.날짜 BETWEEN :start AND :end
+                ORDER BY c.날짜 DESC LIMIT 1) AS 종료가,
+               (SELECT COUNT(*) FROM (
+                    SELECT 1 FROM daily_close c
+                    WHERE c.종목코드 = m.종목코드
+                      AND c.날짜 BETWEEN :start AND :end
+                    LIMIT 2)) AS 거래일수
+        FROM stock_meta m {join}
+        WHERE 1 = 1 {where}
+    )
+    WHERE 거래일수 >= 2 AND 시작가 != 0
+    ORDER BY "수익률(%)" DESC, 종목코드
+    LIMIT :limit
+"""
+# 호출 경로별 SQL을 import 시 한 번만 만들어 두어 문장 캐시가 항상 적중하도록 함
+_SQL_PRICES = _PERIOD_RETURNS_SQL.format(join="", where="")
+_SQL_PRICES_MARKET = _PERIOD_RETURNS_SQL.format(
+    join="", where="AND m.시장 = :market")
+_SQL_PRICES_BY_CODES = _PERIOD_RETURNS_SQL.format(
+    join="", where="AND m.종목코드 IN (SELECT value FROM json_each(:codes))")
+
+# 수익률 결과에 재무 데이터(ROE/영업이익률)를 LEFT JOIN — 없는 종목은 NULL
+_WITH_FINANCIALS_SQL = """
+    SELECT p.*, f.ROE, f.영업이익률
+    FROM ({}) p
+    LEFT JOIN financials f ON f.종목코드 = p.종목코드
+    ORDER BY p."수익률(%)" DESC, p.종목코드
+"""
+_SQL_PRICES_FIN = _WITH_FINANCIALS_SQL.format(_SQL_PRICES)
+_SQL_PRICES_MARKET_FIN = _WITH_FINANCIALS_SQL.format(_SQL_PRICES_MARKET)
+_SQL_PRICES_BY_CODES_FIN = _WITH_FINANCIALS_SQL.format(_SQL_PRICES_BY_CODES)
+
+
+@functools.cache
+def _default_db_path() -> str:
+    """기본 DB 경로 (최초 호출 시에만 data 디렉토리 생성)"""
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    return os.path.join(config.DATA_DIR, "stock_scanner.db")
+
+
+def _chunks(iterable, size: int):
+    """iterable을 size개씩 잘라 리스트로 반환하는 제너레이터"""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
 
 class DatabaseManager:
     """SQLite 데이터베이스 관리 클래스
@@ -18,20 +98,128 @@ class DatabaseManager:
         db_path: 데이터베이스 파일 경로
     """
 
+    # PRAGMA user_version에 기록하는 스키마 버전 (_create_tables 마이그레이션 기준)
+    SCHEMA_VERSION = 2
+    # 이 건수 이상을 처음 저장하면 ANALYZE로 통계 수집
+    ANALYZE_MIN_ROWS = 10000
+    # executemany 1회에 넘기는 최대 행 수
+    INSERT_CHUNK_SIZE = 5000
+    # 대량 저장 시 트랜잭션 1회(COMMIT 1회)당 최대 행 수 — WAL 파일 비대화 방지
+    COMMIT_CHUNK_SIZE = 10000
+    # async 래퍼가 쓰는 DB 전용 스레드 수 (읽기가 쓰기 대기 뒤에 줄 서지 않도록)
+    ASYNC_WORKERS = 4
+
     def __init__(self, db_path: str = None):
         if db_path is None:
-            os.makedirs(config.DATA_DIR, exist_ok=True)
-            db_path = os.path.join(config.DATA_DIR, "stock_scanner.db")
+            db_path = _default_db_path()
         self.db_path = db_path
+
+        # 쓰기/DDL 연결은 1개만 열어 재사용 (봇 이벤트 루프 + to_thread 워커에서
+        # 동시에 호출되므로 lock으로 직렬화). 트랜잭션은 직접 BEGIN/COMMIT.
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        # 읽기는 스레드별 전용 연결로 lock 없이 실행 — WAL 모드라서 쓰기
+        # 트랜잭션이 진행 중이어도 마지막 커밋 시점 데이터를 바로 읽음
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        # async 핸들러에서 호출할 때 이벤트 루프를 막지 않도록 DB 작업을 넘길
+        # 전용 스레드
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.ASYNC_WORKERS, thread_name_prefix="db")
+
         self._create_tables()
         print(f"[DB 초기화] {self.db_path}")
 
-    def _get_conn(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+    def close(self):
+        """DB 연결 종료 (읽기 연결 포함)"""
+        self._executor.shutdown(wait=True)
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._lock:
+            self._conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """PRAGMA 설정을 마친 새 연결 생성 (autocommit, sqlite3.Row)"""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None,
+            cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        return conn
+
+    async def _run_async(self, func, *args, **kwargs):
+        """동기 DB 메서드를 전용 스레드에서 실행하고 결과를 await"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    @contextmanager
+    def _locked(self):
+        """lock을 잡은 상태로 공유 연결을 반환 (DDL/마이그레이션용)"""
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def _reader(self):
+        """현재 스레드 전용 읽기 연결을 반환 (쓰기 lock을 잡지 않음)
+
+        스레드마다 처음 호출될 때 연결을 열고 이후 재사용합니다.
+        query_only로 열어 읽기 경로에서 실수로 쓰지 않도록 합니다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only=ON")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        yield conn
+
+    @contextmanager
+    def _transaction(self):
+        """lock을 잡고 쓰기 트랜잭션 실행 — 정상 종료 시 COMMIT, 예외 시 ROLLBACK
+
+        BEGIN IMMEDIATE로 시작 시점에 쓰기 락을 잡아 중간에 SQLITE_BUSY로
+        실패하는 일을 막습니다. SQLite가 이미 롤백한 경우(RAISE(ROLLBACK),
+        디스크 가득 참 등)에는 ROLLBACK을 생략해 원래 예외를 그대로 전달하고,
+        COMMIT 실패 시에도 롤백해 공유 연결에 트랜잭션이 남지 않도록 합니다.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _configure(conn: sqlite3.Connection):
+        """연결 단위 PRAGMA 설정
+
+        - synchronous=NORMAL: WAL 모드에서는 커밋마다 fsync하지 않아도 안전
+        - temp_store=MEMORY: 정렬/임시 테이블을 메모리에서 처리
+        - mmap_size/cache_size: 읽기 시 syscall과 페이지 재적재 감소
+        - busy_timeout: 다른 프로세스가 쓰기 중이면 즉시 실패하지 않고 대기
+        """
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA busy_timeout=5000")
+        # SQLite round()는 .5 경계 처리가 Python과 달라 수익률 반올림용으로 등록
+        conn.create_function("py_round", 2, round, deterministic=True)
 
     def _create_tables(self):
-        conn = self._get_conn()
-        try:
+        with self._locked() as conn:
+            # WAL은 DB 파일에 영구 저장되므로 최초 1회만 설정하면 됨
+            # (읽기와 쓰기가 서로를 막지 않음)
+            conn.execute("PRAGMA journal_mode=WAL")
+
             # 기존 기간 요약 테이블 (레거시 — 신규 수집은 daily_prices 사용)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS prices (
@@ -61,6 +249,23 @@ class DatabaseManager:
                     UNIQUE(날짜, 종목코드)
                 )
             """)
+            # 수익률 조회용 좁은 테이블: 종가만 (날짜, 종목코드, 종가)로 분리하고
+            # 종목명/시장은 종목당 1행의 stock_meta로 정규화
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS stock_meta (
+                    종목코드 TEXT PRIMARY KEY,
+                    종목명 TEXT NOT NULL,
+                    시장 TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_close (
+                    날짜 TEXT NOT NULL,
+                    종목코드 TEXT NOT NULL,
+                    종가 INTEGER NOT NULL,
+                    PRIMARY KEY(종목코드, 날짜)
+                ) WITHOUT ROWID
+            """)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS financials (
                     종목코드 TEXT NOT NULL,
@@ -80,13 +285,20 @@ class DatabaseManager:
                     UNIQUE(user_id, platform, 종목코드)
                 )
             """)
-            conn.commit()
 
-            # 기존 DB 마이그레이션: platform 컬럼이 없으면 추가
-            cols = [row[1] for row in
-                    conn.execute("PRAGMA table_info(watchlist)")]
-            if 'platform' not in cols:
-                conn.executescript("""
+            # 스키마 버전(user_version)이 낮은 DB만 마이그레이션 검사
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+            # v1: platform 컬럼이 없는 기존 watchlist 변환
+            # (버전 관리 이전 DB는 컬럼 유무를 직접 확인)
+            if version < 1 and 'platform' not in [
+                    row[1] for row in
+                    conn.execute("PRAGMA table_info(watchlist)")]:
+                # executescript는 BEGIN을 직접 관리하지 않으므로 스크립트 안에서
+                # 트랜잭션으로 묶어 중간 실패 시 원래 테이블이 남도록 함
+                try:
+                    conn.executescript("""
+                    BEGIN IMMEDIATE;
                     ALTER TABLE watchlist RENAME TO watchlist_old;
                     CREATE TABLE watchlist (
                         user_id INTEGER NOT NULL,
@@ -100,55 +312,121 @@ class DatabaseManager:
                         SELECT user_id, 'telegram', 종목코드, 종목명, 등록일
                         FROM watchlist_old;
                     DROP TABLE watchlist_old;
-                """)
+                    COMMIT;
+                    """)
+                except sqlite3.Error:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
                 print("[DB 마이그레이션] watchlist 테이블에 platform 컬럼 추가")
-        finally:
-            conn.close()
+
+            # 자동 스캔의 플랫폼/사용자별 전체 조회용
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_wl_platform_user "
+                "ON watchlist(platform, user_id)")
+
+        # v2: daily_close/stock_meta 분리
+        if version < 2:
+            self._backfill_daily_close()
+            # 종목별 조회가 daily_close로 옮겨가 쓰기 비용만 남은 인덱스 제거
+            with self._locked() as conn:
+                conn.execute("DROP INDEX IF EXISTS idx_dp_code_date")
+
+        if version < self.SCHEMA_VERSION:
+            with self._locked() as conn:
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _backfill_daily_close(self):
+        """기존 daily_prices 데이터를 daily_close/stock_meta로 1회 복사"""
+        with self._locked() as conn:
+            if conn.execute("SELECT 1 FROM daily_close LIMIT 1").fetchone():
+                return
+            if not conn.execute("SELECT 1 FROM daily_prices LIMIT 1").fetchone():
+                return
+
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO daily_close (날짜, 종목코드, 종가) "
+                "SELECT 날짜, 종목코드, 종가 FROM daily_prices")
+            # 날짜순으로 덮어써서 가장 최근 종목명/시장이 남도록 함
+            conn.execute(
+                "INSERT OR REPLACE INTO stock_meta (종목코드, 종목명, 시장) "
+                "SELECT 종목코드, 종목명, 시장 FROM daily_prices ORDER BY 날짜")
+        print("[DB 마이그레이션] daily_prices → daily_close/stock_meta 복사")
 
     # ── 일별 가격 (신규 아키텍처) ─────────────────────────
 
-    def save_daily_prices(self, records: list[dict]):
+    def save_daily_prices(self, records: "list[dict] | pd.DataFrame"):
         """일별 OHLCV 데이터를 벌크 INSERT OR REPLACE
 
+        daily_prices(전체 OHLCV)와 함께 수익률 조회용 daily_close(종가),
+        stock_meta(종목명/시장)도 같은 트랜잭션에서 갱신합니다.
+        DataFrame을 넘기면 행 단위 dict 조회 없이 itertuples로 바로 INSERT합니다.
+
         Args:
             records: [{"날짜", "종목코드", "종목명", "시장",
                         "시가", "고가", "저가", "종가", "거래량"}, ...]
+                     또는 같은 컬럼을 가진 DataFrame
         """
-        if not records:
+        if len(records) == 0:
             return
-
-        rows = [
-            (
-                r["날짜"],
-                r["종목코드"],
-                r["종목명"],
-                r["시장"],
-                r.get("시가"),
-                r.get("고가"),
-                r.get("저가"),
-                r.get("종가"),
-                r.get("거래량"),
-            )
-            for r in records
-        ]
-
-        conn = self._get_conn()
-        try:
-            conn.executemany(
-                "INSERT OR REPLACE INTO daily_prices "
-                "(날짜, 종목코드, 종목명, 시장, 시가, 고가, 저가, 종가, 거래량) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                rows,
+        count = len(records)
+
+        if isinstance(records, pd.DataFrame):
+            # 없는 선택 컬럼(시가 등)은 NaN → NULL로 저장됨
+            rows = records.reindex(columns=DAILY_PRICE_COLUMNS).itertuples(
+                index=False, name=None)
+        else:
+            rows = (
+                (
+                    r["날짜"],
+                    r["종목코드"],
+                    r["종목명"],
+                    r["시장"],
+                    r.get("시가"),
+                    r.get("고가"),
+                    r.get("저가"),
+                    r.get("종가"),
+                    r.get("거래량"),
+                )
+                for r in records
             )
-            conn.commit()
-            print(f"[DB 저장] daily_prices {len(rows)}건")
-        finally:
-            conn.close()
+
+        with self._transaction() as conn:
+            # 한 트랜잭션(커밋 1회) 안에서 청크 단위로 나눠 INSERT
+            for chunk in _chunks(rows, self.INSERT_CHUNK_SIZE):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO daily_prices "
+                    "(날짜, 종목코드, 종목명, 시장, 시가, 고가, 저가, 종가, 거래량) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    chunk,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO daily_close (날짜, 종목코드, 종가) "
+                    "VALUES (?, ?, ?)",
+                    [(r[0], r[1], r[7]) for r in chunk],
+                )
+                # 종목당 1행만 남겨 upsert (청크 안에서는 마지막 값 사용)
+                meta = {r[1]: (r[1], r[2], r[3]) for r in chunk}
+                conn.executemany(
+                    "INSERT INTO stock_meta (종목코드, 종목명, 시장) "
+                    "VALUES (?, ?, ?) "
+                    "ON CONFLICT(종목코드) DO UPDATE SET "
+                    "종목명 = excluded.종목명, 시장 = excluded.시장",
+                    meta.values(),
+                )
+            print(f"[DB 저장] daily_prices {count}건")
+
+            # 첫 대량 저장 후 통계를 수집해 쿼리 플래너가 인덱스를 선택하도록 함
+            if count >= self.ANALYZE_MIN_ROWS and not conn.execute(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'sqlite_stat1'").fetchone():
+                conn.execute("ANALYZE")
 
     def get_cached_stock_codes(self, start_date: str, end_date: str) -> set:
         """해당 기간에 완전히 캐시된 종목코드 세트 반환
 
-        종목 전체의 MIN/MAX 날짜를 사용하여 기간 커버 여부를 판단합니다.
+        종목별로 시작/종료 근방 데이터가 모두 있는지로 기간 커버 여부를 판단합니다.
         - MIN(날짜) ≤ start_date + 7일 (시작 근방 데이터 존재)
         - MAX(날짜) ≥ end_date - 7일   (종료 근방 데이터 존재)
         ±7일은 주말/공휴일 여유입니다.
@@ -170,26 +448,39 @@ class DatabaseManager:
             start_threshold = start_date
             end_threshold = end_date
 
-        conn = self._get_conn()
-        try:
-            # BETWEEN 없이 종목별 전역 MIN/MAX 사용
+        with self._reader() as conn:
+            # 종목별 MIN/MAX 집계 대신 (종목코드, 날짜) PK 범위 탐색 2회로 판정
             rows = conn.execute(
                 """
-                SELECT 종목코드 FROM daily_prices
-                GROUP BY 종목코드
-                HAVING MIN(날짜) <= ? AND MAX(날짜) >= ?
+                SELECT DISTINCT 종목코드 FROM daily_close a
+                WHERE 날짜 <= ?
+                  AND EXISTS (
+                      SELECT 1 FROM daily_close b
+                      WHERE b.종목코드 = a.종목코드 AND b.날짜 >= ?
+                  )
                 """,
                 (start_threshold, end_threshold),
-            ).fetchall()
+            )
             return {row[0] for row in rows}
-        finally:
-            conn.close()
+
+    def _get_period_returns(self, query: str, params: dict) -> list[dict]:
+        """기간 수익률 쿼리(_SQL_PRICES*)를 실행 — 정렬/상위 N개 자르기까지 SQL에서 처리
+
+        Args:
+            query: _PERIOD_RETURNS_SQL 기반 SQL 상수
+            params: {"start", "end", "limit"[, "market"]} (limit -1이면 전체)
+
+        Returns:
+            [{"종목코드", "종목명", "시장", "시작가", "종료가", "수익률(%)"}, ...]
+        """
+        with self._reader() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
 
     def get_prices(self, start_date: str, end_date: str,
                    market: str = None, top_n: int = None) -> list[dict]:
         """가격 데이터를 수익률 내림차순으로 조회
 
-        daily_prices 테이블에서 기간 내 첫날 종가(시작가)와
+        daily_close 테이블에서 기간 내 첫날 종가(시작가)와
         마지막날 종가(종료가)를 기반으로 수익률을 계산합니다.
 
         Args:
@@ -201,59 +492,35 @@ class DatabaseManager:
         Returns:
             [{"종목코드", "종목명", "시작가", "종료가", "수익률(%)", "시장"}, ...]
         """
-        query = (
-            "SELECT 종목코드, 종목명, 시장, 날짜, 종가 "
-            "FROM daily_prices WHERE 날짜 BETWEEN ? AND ?"
-        )
-        params: list = [start_date, end_date]
+        params = {"start": start_date, "end": end_date, "limit": top_n or -1}
+        if market:
+            params["market"] = market
+            return self._get_period_returns(_SQL_PRICES_MARKET, params)
+        return self._get_period_returns(_SQL_PRICES, params)
+
+    def get_prices_with_financials(self, start_date: str, end_date: str,
+                                   market: str = None,
+                                   top_n: int = None) -> list[dict]:
+        """get_prices() 결과에 재무 데이터를 붙여 한 쿼리로 조회
+
+        get_prices() 후 get_financials()를 따로 호출하는 대신 financials를
+        LEFT JOIN합니다. 재무 데이터가 없는 종목의 ROE/영업이익률은 None입니다.
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            market: '코스피' 또는 '코스닥' (None이면 전체)
+            top_n: 상위 N개만 반환 (None이면 전체)
 
+        Returns:
+            [{"종목코드", "종목명", "시장", "시작가", "종료가", "수익률(%)",
+              "ROE", "영업이익률"}, ...]
+        """
+        params = {"start": start_date, "end": end_date, "limit": top_n or -1}
         if market:
-            query += " AND 시장 = ?"
-            params.append(market)
-
-        conn = self._get_conn()
-        try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, params).fetchall()
-        finally:
-            conn.close()
-
-        # 종목별로 그룹핑하여 시작가/종료가 계산
-        stocks: dict = {}
-        for row in rows:
-            code = row["종목코드"]
-            if code not in stocks:
-                stocks[code] = {
-                    "종목코드": code,
-                    "종목명": row["종목명"],
-                    "시장": row["시장"],
-                    "days": [],
-                }
-            stocks[code]["days"].append((row["날짜"], row["종가"]))
-
-        results = []
-        for code, data in stocks.items():
-            days = sorted(data["days"])  # 날짜 오름차순
-            if len(days) < 2:
-                continue
-            start_price = days[0][1]
-            end_price = days[-1][1]
-            if not start_price:
-                continue
-            return_rate = round((end_price - start_price) / start_price * 100, 2)
-            results.append({
-                "종목코드": code,
-                "종목명": data["종목명"],
-                "시장": data["시장"],
-                "시작가": start_price,
-                "종료가": end_price,
-                "수익률(%)": return_rate,
-            })
-
-        results.sort(key=lambda x: x["수익률(%)"], reverse=True)
-        if top_n:
-            results = results[:top_n]
-        return results
+            params["market"] = market
+            return self._get_period_returns(_SQL_PRICES_MARKET_FIN, params)
+        return self._get_period_returns(_SQL_PRICES_FIN, params)
 
     def get_prices_by_codes(self, start_date: str, end_date: str,
                             stock_codes: list[str]) -> list[dict]:
@@ -270,67 +537,47 @@ class DatabaseManager:
         if not stock_codes:
             return []
 
-        placeholders = ",".join("?" for _ in stock_codes)
-        query = (
-            f"SELECT 종목코드, 종목명, 시장, 날짜, 종가 "
-            f"FROM daily_prices WHERE 날짜 BETWEEN ? AND ? "
-            f"AND 종목코드 IN ({placeholders})"
-        )
-        params = [start_date, end_date] + list(stock_codes)
-
-        conn = self._get_conn()
-        try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, params).fetchall()
-        finally:
-            conn.close()
-
-        stocks: dict = {}
-        for row in rows:
-            code = row["종목코드"]
-            if code not in stocks:
-                stocks[code] = {
-                    "종목코드": code,
-                    "종목명": row["종목명"],
-                    "시장": row["시장"],
-                    "days": [],
-                }
-            stocks[code]["days"].append((row["날짜"], row["종가"]))
-
-        results = []
-        for code, data in stocks.items():
-            days = sorted(data["days"])
-            if len(days) < 2:
-                continue
-            start_price = days[0][1]
-            end_price = days[-1][1]
-            if not start_price:
-                continue
-            return_rate = round((end_price - start_price) / start_price * 100, 2)
-            results.append({
-                "종목코드": code,
-                "종목명": data["종목명"],
-                "시장": data["시장"],
-                "시작가": start_price,
-                "종료가": end_price,
-                "수익률(%)": return_rate,
-            })
-
-        results.sort(key=lambda x: x["수익률(%)"], reverse=True)
-        return results
+        # 코드 목록을 JSON 배열 하나로 바인딩 — 목록 길이와 무관하게 SQL이
+        # 고정되어 바인딩 수 제한이 없고 준비된 문장도 재사용됨
+        return self._get_period_returns(
+            _SQL_PRICES_BY_CODES,
+            {"start": start_date, "end": end_date, "limit": -1,
+             "codes": json.dumps(list(stock_codes))})
+
+    def get_prices_by_codes_with_financials(self, start_date: str,
+                                            end_date: str,
+                                            stock_codes: list[str]) -> list[dict]:
+        """get_prices_by_codes() 결과에 재무 데이터를 붙여 한 쿼리로 조회
+
+        Args:
+            start_date: 시작일
+            end_date: 종료일
+            stock_codes: 종목코드 리스트
+
+        Returns:
+            [{"종목코드", "종목명", "시장", "시작가", "종료가", "수익률(%)",
+              "ROE", "영업이익률"}, ...]
+        """
+        if not stock_codes:
+            return []
+
+        return self._get_period_returns(
+            _SQL_PRICES_BY_CODES_FIN,
+            {"start": start_date, "end": end_date, "limit": -1,
+             "codes": json.dumps(list(stock_codes))})
 
     def has_data(self, start_date: str, end_date: str) -> bool:
         """해당 기간의 일별 가격 데이터가 존재하는지 확인"""
-        conn = self._get_conn()
-        try:
+        with self._reader() as conn:
+            # 존재 여부만 필요하므로 첫 행에서 바로 중단
+            # (daily_close는 종목코드가 선행 키라 날짜 범위 탐색이 안 되므로
+            #  UNIQUE(날짜, 종목코드) 인덱스가 있는 daily_prices를 조회)
             row = conn.execute(
-                "SELECT COUNT(DISTINCT 종목코드) FROM daily_prices "
-                "WHERE 날짜 BETWEEN ? AND ?",
+                "SELECT 1 FROM daily_prices "
+                "WHERE 날짜 BETWEEN ? AND ? LIMIT 1",
                 (start_date, end_date),
             ).fetchone()
-            return row[0] > 0
-        finally:
-            conn.close()
+            return row is not None
 
     # ── 레거시 (기간 요약 저장) ───────────────────────────
 
@@ -343,7 +590,8 @@ class DatabaseManager:
         if not records:
             return
 
-        rows = [
+        # 리스트로 만들지 않고 제너레이터로 executemany에 바로 전달
+        rows = (
             (
                 start_date,
                 end_date,
@@ -355,20 +603,17 @@ class DatabaseManager:
                 r.get("수익률(%)"),
             )
             for r in records
-        ]
-
-        conn = self._get_conn()
-        try:
-            conn.executemany(
-                "INSERT OR REPLACE INTO prices "
-                "(시작일, 종료일, 종목코드, 종목명, 시장, 시작가, 종료가, 수익률) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                rows,
-            )
-            conn.commit()
-            print(f"[DB 저장] prices(레거시) {len(rows)}건 ({market})")
-        finally:
-            conn.close()
+        )
+
+        for chunk in _chunks(rows, self.COMMIT_CHUNK_SIZE):
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO prices "
+                    "(시작일, 종료일, 종목코드, 종목명, 시장, 시작가, 종료가, 수익률) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    chunk,
+                )
+        print(f"[DB 저장] prices(레거시) {len(records)}건 ({market})")
 
     # ── 재무 데이터 ───────────────────────────────────────
 
@@ -382,7 +627,7 @@ class DatabaseManager:
             return
 
         today = datetime.date.today().isoformat()
-        rows = [
+        rows = (
             (
                 r["종목코드"],
                 r.get("ROE"),
@@ -390,20 +635,17 @@ class DatabaseManager:
                 today,
             )
             for r in records
-        ]
-
-        conn = self._get_conn()
-        try:
-            conn.executemany(
-                "INSERT OR REPLACE INTO financials "
-                "(종목코드, ROE, 영업이익률, 업데이트날짜) "
-                "VALUES (?, ?, ?, ?)",
-                rows,
-            )
-            conn.commit()
-            print(f"[DB 저장] financials {len(rows)}건")
-        finally:
-            conn.close()
+        )
+
+        for chunk in _chunks(rows, self.COMMIT_CHUNK_SIZE):
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO financials "
+                    "(종목코드, ROE, 영업이익률, 업데이트날짜) "
+                    "VALUES (?, ?, ?, ?)",
+                    chunk,
+                )
+        print(f"[DB 저장] financials {len(records)}건")
 
     def get_financials(self, stock_codes: list[str]) -> dict:
         """종목코드 리스트로 재무 데이터 조회
@@ -417,17 +659,13 @@ class DatabaseManager:
         if not stock_codes:
             return {}
 
-        placeholders = ",".join("?" for _ in stock_codes)
-        query = (
-            f"SELECT 종목코드, ROE, 영업이익률 "
-            f"FROM financials WHERE 종목코드 IN ({placeholders})"
-        )
-
-        conn = self._get_conn()
-        try:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(query, stock_codes).fetchall()
-
+        # get_prices_by_codes와 같이 JSON 배열 하나로 바인딩해 SQL을 고정
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT 종목코드, ROE, 영업이익률 FROM financials "
+                "WHERE 종목코드 IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(stock_codes)),),
+            )
             return {
                 row["종목코드"]: {
                     "ROE": row["ROE"],
@@ -435,8 +673,32 @@ class DatabaseManager:
                 }
                 for row in rows
             }
-        finally:
-            conn.close()
+
+    def get_fresh_financial_codes(self, stock_codes: list[str],
+                                  since_date: str) -> set[str]:
+        """since_date 이후 재무 데이터가 갱신된 종목코드 조회
+
+        ROE, 영업이익률이 모두 비어 있는 행은 조회 실패로 보고 제외합니다.
+
+        Args:
+            stock_codes: 종목코드 리스트
+            since_date: 기준일 (YYYY-MM-DD, 업데이트날짜와 같은 형식)
+
+        Returns:
+            갱신된 종목코드 set
+        """
+        if not stock_codes:
+            return set()
+
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT 종목코드 FROM financials "
+                "WHERE 종목코드 IN (SELECT value FROM json_each(?)) "
+                "AND 업데이트날짜 >= ? "
+                "AND (ROE IS NOT NULL OR 영업이익률 IS NOT NULL)",
+                (json.dumps(list(stock_codes)), since_date),
+            )
+            return {row[0] for row in rows}
 
     # ── 관심종목 ──────────────────────────────────────────
 
@@ -453,18 +715,25 @@ class DatabaseManager:
         Returns:
             추가 성공이면 True, 이미 등록된 종목이면 False
         """
-        conn = self._get_conn()
-        try:
-            today = datetime.date.today().isoformat()
+        today = datetime.date.today().isoformat()
+        params = (user_id, platform, stock_code, stock_name, today)
+        with self._transaction() as conn:
+            if _HAS_RETURNING:
+                # 삽입된 경우에만 행이 반환되므로 rowcount 없이 한 문장으로 판정
+                rows = conn.execute(
+                    "INSERT INTO watchlist "
+                    "(user_id, platform, 종목코드, 종목명, 등록일) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT DO NOTHING RETURNING 1",
+                    params,
+                ).fetchall()
+                return bool(rows)
             cursor = conn.execute(
                 "INSERT OR IGNORE INTO watchlist "
                 "(user_id, platform, 종목코드, 종목명, 등록일) VALUES (?, ?, ?, ?, ?)",
-                (user_id, platform, stock_code, stock_name, today),
+                params,
             )
-            conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
 
     def remove_watchlist(self, user_id: int, stock_code: str,
                          platform: str = 'telegram') -> bool:
@@ -478,17 +747,13 @@ class DatabaseManager:
         Returns:
             삭제했으면 True, 등록되어 있지 않았으면 False
         """
-        conn = self._get_conn()
-        try:
+        with self._transaction() as conn:
             cursor = conn.execute(
                 "DELETE FROM watchlist "
                 "WHERE user_id = ? AND platform = ? AND 종목코드 = ?",
                 (user_id, platform, stock_code),
             )
-            conn.commit()
             return cursor.rowcount > 0
-        finally:
-            conn.close()
 
     def get_all_watchlist_grouped(self) -> dict:
         """모든 사용자의 관심종목을 플랫폼 + user_id별로 그룹화하여 반환
@@ -497,29 +762,24 @@ class DatabaseManager:
             {"telegram": {user_id: [{"종목코드": ..., "종목명": ...}, ...]},
              "discord":  {user_id: [...]}}
         """
-        conn = self._get_conn()
-        try:
-            conn.row_factory = sqlite3.Row
+        with self._reader() as conn:
+            # 사용자별 종목 목록을 SQLite에서 JSON 배열로 묶어 한 행으로 받음
             rows = conn.execute(
-                "SELECT user_id, platform, 종목코드, 종목명 FROM watchlist "
-                "ORDER BY platform, user_id"
-            ).fetchall()
+                """
+                SELECT platform, user_id,
+                       json_group_array(json_object(
+                           '종목코드', 종목코드, '종목명', 종목명)) AS items
+                FROM (SELECT * FROM watchlist
+                      ORDER BY platform, user_id, rowid)
+                GROUP BY platform, user_id
+                """
+            )
 
             grouped: dict = {}
             for row in rows:
-                plat = row["platform"]
-                uid = row["user_id"]
-                if plat not in grouped:
-                    grouped[plat] = {}
-                if uid not in grouped[plat]:
-                    grouped[plat][uid] = []
-                grouped[plat][uid].append({
-                    "종목코드": row["종목코드"],
-                    "종목명": row["종목명"],
-                })
+                grouped.setdefault(row["platform"], {})[row["user_id"]] = (
+                    json.loads(row["items"]))
             return grouped
-        finally:
-            conn.close()
 
     def get_watchlist(self, user_id: int,
                       platform: str = 'telegram') -> list[dict]:
@@ -532,21 +792,38 @@ class DatabaseManager:
         Returns:
             [{"종목코드": ..., "종목명": ..., "등록일": ...}, ...]
         """
-        conn = self._get_conn()
-        try:
-            conn.row_factory = sqlite3.Row
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT 종목코드, 종목명, 등록일 FROM watchlist "
                 "WHERE user_id = ? AND platform = ? ORDER BY 등록일",
                 (user_id, platform),
-            ).fetchall()
-            return [
-                {
-                    "종목코드": row["종목코드"],
-                    "종목명": row["종목명"],
-                    "등록일": row["등록일"],
-                }
-                for row in rows
-            ]
-        finally:
-            conn.close()
+            )
+            return [dict(row) for row in rows]
+
+    # ── async 래퍼 (봇 이벤트 루프용) ─────────────────────
+
+    async def ahas_data(self, start_date: str, end_date: str) -> bool:
+        """has_data()의 async 버전"""
+        return await self._run_async(self.has_data, start_date, end_date)
+
+    async def aadd_watchlist(self, user_id: int, stock_code: str,
+                             stock_name: str,
+                             platform: str = 'telegram') -> bool:
+        """add_watchlist()의 async 버전"""
+        return await self._run_async(
+            self.add_watchlist, user_id, stock_code, stock_name, platform)
+
+    async def aremove_watchlist(self, user_id: int, stock_code: str,
+                                platform: str = 'telegram') -> bool:
+        """remove_watchlist()의 async 버전"""
+        return await self._run_async(
+            self.remove_watchlist, user_id, stock_code, platform)
+
+    async def aget_watchlist(self, user_id: int,
+                             platform: str = 'telegram') -> list[dict]:
+        """get_watchlist()의 async 버전"""
+        return await self._run_async(self.get_watchlist, user_id, platform)
+
+    async def aget_all_watchlist_grouped(self) -> dict:
+        """get_all_watchlist_grouped()의 async 버전"""
+        return await self._run_async(self.get_all_watchlist_grouped)
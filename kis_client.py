@@ -7,15 +7,35 @@
 
 import os
 import io
+import re
+import glob
+import json
 import time
 import threading
 import zipfile
 import requests
 import datetime
+from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
 import pandas as pd
 
+# 분석 결과 CSV, 마스터 파일 캐시 저장 경로
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+# .env 한 줄: 앞뒤 공백을 제외한 KEY=VALUE ('#'으로 시작하는 줄은 주석)
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.M)
+
 
 def _load_env(env_path: str = None):
     """프로젝트 루트의 .env 파일에서 환경 변수를 로드하는 헬퍼 함수
@@ -33,24 +53,46 @@ def _load_env(env_path: str = None):
         return
 
     with open(env_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            # 빈 줄, 주석 건너뛰기
-            if not line or line.startswith("#"):
-                continue
-            # KEY=VALUE 형태 파싱
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key, value = key.strip(), value.strip()
-                # 이미 설정된 환경 변수는 보존
-                if key not in os.environ:
-                    os.environ[key] = value
+        content = f.read()
+
+    # KEY=VALUE 형태만 한 번에 추출 (빈 줄, 주석 줄은 패턴에 걸리지 않음)
+    # 이미 설정된 환경 변수와 파일 내 중복 키는 먼저 나온 값을 보존
+    for key, value in _ENV_LINE_RE.findall(content):
+        os.environ.setdefault(key, value)
 
 
 # 모듈 임포트 시 .env 파일 자동 로드
 _load_env()
 
 
+class _RateLimiter:
+    """스레드 안전 토큰 버킷 방식의 요청 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고(최대 burst개) 요청마다 1개를 소비합니다.
+    토큰이 남아 있으면 바로 통과하고, 비어 있을 때만 차례가 올 때까지 대기합니다.
+    대기 시간은 락 안에서 예약하고 sleep은 락 밖에서 하므로 대기 순서대로 풀립니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst,
+                               self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
 class KISClient:
     """한국투자증권 REST API 클라이언트
 
@@ -66,6 +108,20 @@ class KISClient:
     REAL_URL = "https://openapi.koreainvestment.com:9443"
     # 모의투자 URL (필요 시 사용)
     VIRTUAL_URL = "https://openapivts.koreainvestment.com:29443"
+    # 종목별 API 병렬 조회 스레드 수 (세션 커넥션 풀 크기 이내)
+    MAX_WORKERS = 8
+    # KIS 시세/재무 API 초당 호출 한도 (실제 한도 20건보다 약간 낮게)
+    # 1초 구간 최대 호출 수 = API_RATE_PER_SEC + API_BURST
+    API_RATE_PER_SEC = 18
+    API_BURST = 2
+    # 연결 확인 성공 결과 재사용 시간 (초)
+    CONNECTION_CHECK_TTL = 60
+    # 재무 데이터 메모리 캐시 유효 시간 (초)
+    FINANCIAL_CACHE_TTL = 3600
+    # 일봉 1회 응답(최대 100거래일)으로 다 담기지 않을 수 있는 기간 (달력일)
+    PERIOD_SPLIT_DAYS = 140
+    # 시작/종료일 근처 종가를 찾는 조회 구간 폭 (연휴 대비, 달력일)
+    PERIOD_EDGE_DAYS = 10
 
     def __init__(self, app_key: str, app_secret: str, base_url: str = None):
         """KISClient 초기화
@@ -82,8 +138,44 @@ class KISClient:
         # 토큰 관련 상태 초기화
         self.access_token = None
         self.token_expired_at = None
+        # 현재 토큰 기준 공통 헤더 (tr_id 제외, 토큰 발급 시 갱신)
+        self._base_headers = {}
+        # 토큰 유효 기한 (time.monotonic 기준, 만료 1분 전)
+        self._token_valid_until_mono = 0.0
         self._token_lock = threading.Lock()
 
+        # 모든 API 호출이 공유하는 세션 (keep-alive로 TCP/TLS 연결 재사용)
+        # 재시도 후에도 실패하면 예외 대신 마지막 응답을 그대로 반환
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False))
+        self._session.mount("https://", adapter)
+        # 마지막 연결 확인 성공 시각 (time.monotonic 기준)
+        self._last_conn_ok_at = None
+        # 모든 워커 스레드가 공유하는 API 호출 속도 제한
+        self._rate_limiter = _RateLimiter(self.API_RATE_PER_SEC, self.API_BURST)
+
+        # 재무 데이터 캐시 {종목코드: (저장 시각(monotonic), 결과)}
+        self._financial_cache = {}
+        self._financial_cache_lock = threading.Lock()
+
+    def _api_get(self, url: str, headers: dict, params: dict):
+        """속도 제한(API_RATE_PER_SEC)을 적용한 KIS API GET 요청
+
+        Args:
+            url: 요청 URL
+            headers: set_header()로 만든 요청 헤더
+            params: 쿼리 파라미터
+
+        Returns:
+            requests.Response
+        """
+        self._rate_limiter.acquire()
+        return self._session.get(url, headers=headers, params=params)
+
     def get_access_token(self) -> str:
         """접근 토큰(Access Token) 발급
 
@@ -116,14 +208,14 @@ class KISClient:
                 "appsecret": self.app_secret,
             }
 
-            response = requests.post(url, json=body)
+            response = self._session.post(url, json=body)
 
             if response.status_code != 200:
                 raise RuntimeError(
                     f"토큰 발급 실패 (status={response.status_code}): {response.text}"
                 )
 
-            data = response.json()
+            data = _json_loads(response.content)
 
             # 토큰과 만료 시각 저장
             self.access_token = data["access_token"]
@@ -131,6 +223,16 @@ class KISClient:
             self.token_expired_at = datetime.datetime.strptime(
                 data["access_token_token_expired"], "%Y-%m-%d %H:%M:%S"
             )
+            self._base_headers = {
+                "content-type": "application/json; charset=utf-8",
+                "authorization": f"Bearer {self.access_token}",
+                "appkey": self.app_key,
+                "appsecret": self.app_secret,
+            }
+            # 만료 1분 전까지의 남은 시간을 monotonic 기한으로 환산
+            remaining = (self.token_expired_at - datetime.datetime.now()
+                         ).total_seconds() - 60
+            self._token_valid_until_mono = time.monotonic() + remaining
 
             return self.access_token
 
@@ -138,16 +240,13 @@ class KISClient:
         """현재 저장된 토큰이 유효한지 확인
 
         만료 시각 1분 전을 기준으로 판단하여, 만료 직전 요청 실패를 방지합니다.
+        기한은 발급 시점에 monotonic 시각으로 미리 계산해 두므로
+        매 요청마다 현재 시각 조회나 날짜 연산을 하지 않습니다.
 
         Returns:
             토큰이 유효하면 True, 아니면 False
         """
-        if self.access_token is None or self.token_expired_at is None:
-            return False
-
-        # 만료 1분 전부터 무효로 판단 (여유 시간 확보)
-        buffer = datetime.timedelta(minutes=1)
-        return datetime.datetime.now() < (self.token_expired_at - buffer)
+        return time.monotonic() < self._token_valid_until_mono
 
     def set_header(self, tr_id: str) -> dict:
         """API 요청 공통 헤더 생성
@@ -165,15 +264,8 @@ class KISClient:
         if not self._is_token_valid():
             self.get_access_token()
 
-        headers = {
-            "content-type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {self.access_token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-        }
-
-        return headers
+        # 토큰 발급 시 만들어 둔 공통 헤더에 tr_id만 추가
+        return {**self._base_headers, "tr_id": tr_id}
 
     def _download_stock_list(self, market_code: str) -> list[dict]:
         """마스터 파일에서 종목 리스트를 다운로드하여 파싱
@@ -196,36 +288,74 @@ class KISClient:
         else:
             raise ValueError(f"지원하지 않는 market_code: {market_code} ('J' 또는 'Q')")
 
-        response = requests.get(url)
+        # 마스터 파일은 하루 1회 갱신되므로 당일 캐시가 있으면 재사용
+        market_label = '코스피' if market_code == 'J' else '코스닥'
+        cache_path = os.path.join(
+            _DATA_DIR,
+            f"master_{market_code}_{datetime.date.today():%Y%m%d}.json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    stocks = json.load(f)
+                print(f"[종목 리스트] {len(stocks)}개 종목 로드 완료 "
+                      f"({market_label}, 캐시)")
+                return stocks
+            except (OSError, ValueError) as e:
+                print(f"[WARN] 마스터 캐시 읽기 실패, 다시 다운로드: {e}")
+
+        response = self._session.get(url)
         if response.status_code != 200:
             raise RuntimeError(f"마스터 파일 다운로드 실패 (status={response.status_code})")
 
-        # 메모리 내 압축 해제
+        # 압축 해제와 CP949 디코딩을 스트리밍으로 처리하여
+        # 압축 해제된 전체 바이트·문자열·라인 리스트를 메모리에 만들지 않음
+        stocks = []
         with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
             file_name = zf.namelist()[0]
-            raw_data = zf.read(file_name)
-
-        # CP949로 디코딩 후 라인 분리
-        lines = raw_data.decode("cp949").strip().split("\n")
-
-        stocks = []
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Part 2(고정폭 데이터)를 제외한 Part 1에서 종목코드/종목명 추출
-            part1 = line[:-part2_len]
-            short_code = part1[0:9].rstrip()
-            korean_name = part1[21:].strip()
+            with zf.open(file_name) as raw, \
+                    io.TextIOWrapper(raw, encoding="cp949", newline="\n") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    # Part 2(고정폭 데이터)를 제외한 Part 1에서 종목코드/종목명 추출
+                    part1 = line[:-part2_len]
+                    short_code = part1[0:9].rstrip()
+                    korean_name = part1[21:].strip()
+
+                    # 6자리 숫자 종목코드만 포함 (ETF, 우선주 등 포함)
+                    if len(short_code) == 6 and short_code.isdigit():
+                        stocks.append({"종목코드": short_code,
+                                       "종목명": korean_name})
+
+        self._save_master_cache(cache_path, market_code, stocks)
+
+        print(f"[종목 리스트] {len(stocks)}개 종목 로드 완료 ({market_label})")
+        return stocks
 
-            # 6자리 숫자 종목코드만 포함 (ETF, 우선주 등 포함)
-            if len(short_code) == 6 and short_code.isdigit():
-                stocks.append({"종목코드": short_code, "종목명": korean_name})
+    def _save_master_cache(self, cache_path: str, market_code: str,
+                           stocks: list[dict]):
+        """파싱한 종목 리스트를 당일 캐시 파일로 저장하고 이전 날짜 캐시는 삭제
 
-        print(f"[종목 리스트] {len(stocks)}개 종목 로드 완료 "
-              f"({'코스피' if market_code == 'J' else '코스닥'})")
-        return stocks
+        Args:
+            cache_path: 저장할 캐시 파일 경로
+            market_code: "J" (코스피) 또는 "Q" (코스닥)
+            stocks: 종목 리스트
+        """
+        try:
+            os.makedirs(_DATA_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(stocks, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+
+            pattern = os.path.join(_DATA_DIR, f"master_{market_code}_*.json")
+            for old_path in glob.glob(pattern):
+                if old_path != cache_path:
+                    os.remove(old_path)
+        except OSError as e:
+            print(f"[WARN] 마스터 캐시 저장 실패: {e}")
 
     def _get_period_price(self, stock_code: str, start_date: str,
                           end_date: str) -> tuple:
@@ -239,41 +369,35 @@ class KISClient:
         Returns:
             (시작 종가, 종료 종가) 튜플. 데이터 부족 시 (None, None)
         """
-        url = (f"{self.base_url}/uapi/domestic-stock/v1/quotations/"
-               "inquire-daily-itemchartprice")
-        headers = self.set_header(tr_id="FHKST03010100")
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": stock_code,
-            "FID_INPUT_DATE_1": start_date,
-            "FID_INPUT_DATE_2": end_date,
-            "FID_PERIOD_DIV_CODE": "D",
-            "FID_ORG_ADJ_PRC": "0",
-        }
-
-        response = requests.get(url, headers=headers, params=params)
-
-        if response.status_code != 200:
-            return (None, None)
-
-        data = response.json()
-        if data.get("rt_cd") != "0":
-            return (None, None)
-
-        records = data.get("output2", [])
-        if not records or len(records) < 2:
-            return (None, None)
-
-        # output2는 최신일이 먼저, 과거일이 뒤에 정렬
-        # 유효한 종가(0이 아닌)를 가진 레코드 필터링
-        valid_records = [r for r in records
-                         if r.get("stck_clpr") and int(r["stck_clpr"]) > 0]
-
-        if len(valid_records) < 2:
-            return (None, None)
-
-        end_price = int(valid_records[0]["stck_clpr"])      # 종료일 근처 종가
-        start_price = int(valid_records[-1]["stck_clpr"])    # 시작일 근처 종가
+        # get_daily_ohlcv()가 종가 0인 레코드를 이미 걸러서 반환
+        # (최신일이 먼저, 과거일이 뒤에 정렬)
+        start = datetime.datetime.strptime(start_date, "%Y%m%d")
+        end = datetime.datetime.strptime(end_date, "%Y%m%d")
+
+        if (end - start).days <= self.PERIOD_SPLIT_DAYS:
+            records = self.get_daily_ohlcv(stock_code, start_date, end_date)
+            if len(records) < 2:
+                return (None, None)
+            return (int(records[-1]["stck_clpr"]), int(records[0]["stck_clpr"]))
+
+        # 긴 기간은 전체 구간 대신 시작/종료일 근처의 짧은 구간만 조회
+        # (한 번에 받으면 최근 100거래일만 와서 시작일 근처가 잘리기도 함)
+        edge = datetime.timedelta(days=self.PERIOD_EDGE_DAYS)
+        tail = self.get_daily_ohlcv(
+            stock_code, (end - edge).strftime("%Y%m%d"), end_date)
+        head = self.get_daily_ohlcv(
+            stock_code, start_date, (start + edge).strftime("%Y%m%d"))
+        if not tail or not head:
+            # 종료일 근처 거래정지, 기간 중 상장 등으로 한쪽 구간에 데이터가
+            # 없으면 전체 구간 조회 결과로 대체 (가장 최근/가장 오래된 종가)
+            full = self.get_daily_ohlcv(stock_code, start_date, end_date)
+            if len(full) < 2:
+                return (None, None)
+            tail = tail or full
+            head = head or full
+
+        end_price = int(tail[0]["stck_clpr"])      # 종료일 근처 종가
+        start_price = int(head[-1]["stck_clpr"])   # 시작일 근처 종가
 
         return (start_price, end_price)
 
@@ -281,8 +405,8 @@ class KISClient:
                         end_date: str) -> list[dict]:
         """종목의 일별 OHLCV(시가/고가/저가/종가/거래량) 데이터를 조회
 
-        _get_period_price()와 동일한 엔드포인트를 사용하되,
-        output2의 전체 레코드를 반환합니다.
+        _get_period_price()도 이 메서드의 결과에서
+        시작/종료 종가를 꺼내 사용합니다.
         페이지네이션은 호출부(analysis_engine.py)에서 처리합니다.
 
         Args:
@@ -308,11 +432,11 @@ class KISClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._api_get(url, headers, params)
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = _json_loads(response.content)
             if data.get("rt_cd") != "0":
                 return []
 
@@ -362,11 +486,11 @@ class KISClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._api_get(url, headers, params)
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = _json_loads(response.content)
             if data.get("rt_cd") != "0":
                 return []
 
@@ -391,7 +515,32 @@ class KISClient:
             return []
 
     def _get_financial_data(self, stock_code: str) -> dict:
-        """종목의 ROE와 영업이익률을 조회
+        """종목의 ROE와 영업이익률을 조회 (FINANCIAL_CACHE_TTL 동안 캐시)
+
+        재무 데이터는 분기 단위로 바뀌므로 같은 종목을 반복 조회할 때는
+        API를 다시 호출하지 않습니다. 두 값이 모두 없는 결과는 캐시하지 않습니다.
+
+        Args:
+            stock_code: 종목코드 (예: "005930")
+
+        Returns:
+            {"ROE": float or None, "영업이익률": float or None}
+        """
+        now = time.monotonic()
+        with self._financial_cache_lock:
+            cached = self._financial_cache.get(stock_code)
+        if cached is not None and now - cached[0] < self.FINANCIAL_CACHE_TTL:
+            return dict(cached[1])
+
+        result = self._fetch_financial_data(stock_code)
+        if result["ROE"] is not None or result["영업이익률"] is not None:
+            with self._financial_cache_lock:
+                self._financial_cache[stock_code] = (time.monotonic(),
+                                                     dict(result))
+        return result
+
+    def _fetch_financial_data(self, stock_code: str) -> dict:
+        """종목의 ROE와 영업이익률을 API로 조회
 
         KIS Open API의 재무비율/수익성비율 엔드포인트를 호출합니다.
 
@@ -405,64 +554,82 @@ class KISClient:
 
         # API 1 — 재무비율 (ROE 조회)
         try:
-            url = f"{self.base_url}/uapi/domestic-stock/v1/finance/financial-ratio"
-            headers = self.set_header(tr_id="FHKST66430300")
-            params = {
-                "FID_DIV_CLS_CODE": "0",
-                "fid_cond_mrkt_div_code": "J",
-                "fid_input_iscd": stock_code,
-            }
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("rt_cd") == "0":
-                    output = data.get("output", [])
-                    if output and len(output) > 0:
-                        roe_val = output[0].get("roe_val", "")
-                        if roe_val and roe_val.strip():
-                            result["ROE"] = float(roe_val)
+            row = self._get_finance_output("financial-ratio", "FHKST66430300",
+                                           stock_code)
+            if row:
+                roe_val = row.get("roe_val", "")
+                if roe_val and roe_val.strip():
+                    result["ROE"] = float(roe_val)
         except Exception as e:
             print(f"    [재무비율 오류] {stock_code}: {e}")
 
-        time.sleep(0.3)
-
         # API 2 — 수익성비율 (영업이익률 조회)
         try:
-            url = f"{self.base_url}/uapi/domestic-stock/v1/finance/profit-ratio"
-            headers = self.set_header(tr_id="FHKST66430400")
-            params = {
-                "FID_DIV_CLS_CODE": "0",
-                "fid_cond_mrkt_div_code": "J",
-                "fid_input_iscd": stock_code,
-            }
-            response = requests.get(url, headers=headers, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("rt_cd") == "0":
-                    output = data.get("output", [])
-                    if output and len(output) > 0:
-                        # 영업이익률 필드 탐색: sale_oper_rate > sale_totl_rate
-                        oper_rate = output[0].get("sale_oper_rate", "")
-                        if oper_rate and oper_rate.strip():
-                            result["영업이익률"] = float(oper_rate)
-                        else:
-                            totl_rate = output[0].get("sale_totl_rate", "")
-                            if totl_rate and totl_rate.strip():
-                                result["영업이익률"] = float(totl_rate)
+            row = self._get_finance_output("profit-ratio", "FHKST66430400",
+                                           stock_code)
+            if row:
+                # 영업이익률 필드 탐색: sale_oper_rate > sale_totl_rate
+                oper_rate = row.get("sale_oper_rate", "")
+                if oper_rate and oper_rate.strip():
+                    result["영업이익률"] = float(oper_rate)
+                else:
+                    totl_rate = row.get("sale_totl_rate", "")
+                    if totl_rate and totl_rate.strip():
+                        result["영업이익률"] = float(totl_rate)
         except Exception as e:
             print(f"    [수익성비율 오류] {stock_code}: {e}")
 
         return result
 
+    def _get_finance_output(self, endpoint: str, tr_id: str,
+                            stock_code: str) -> Optional[dict]:
+        """재무 API(/finance/{endpoint})를 호출하여 가장 최근 결산 행을 반환
+
+        Args:
+            endpoint: 재무 API 경로 (예: "financial-ratio", "profit-ratio")
+            tr_id: 거래 ID
+            stock_code: 종목코드 (예: "005930")
+
+        Returns:
+            output의 첫 번째 행 딕셔너리. 응답 실패 또는 데이터 없음 시 None
+        """
+        url = f"{self.base_url}/uapi/domestic-stock/v1/finance/{endpoint}"
+        headers = self.set_header(tr_id=tr_id)
+        params = {
+            "FID_DIV_CLS_CODE": "0",
+            "fid_cond_mrkt_div_code": "J",
+            "fid_input_iscd": stock_code,
+        }
+        response = self._api_get(url, headers, params)
+        if response.status_code != 200:
+            return None
+
+        data = _json_loads(response.content)
+        if data.get("rt_cd") != "0":
+            return None
+
+        output = data.get("output")
+        return output[0] if output else None
+
     def load_stock_list(self):
         """코스피+코스닥 종목 리스트를 캐시에 로드
 
-        봇 시작 시 1회 호출하여 self._stock_cache에 저장합니다.
-        get_stock_info()에서 이름 기반 검색에 활용됩니다.
+        봇 시작 시 1회 호출하여 self._stock_cache에 저장하고,
+        이름/코드 검색용 인덱스(self._name_to_stock, self._code_to_stock)도 만듭니다.
         """
-        kospi = self._download_stock_list("J")
-        kosdaq = self._download_stock_list("Q")
+        # 두 시장 마스터 파일은 서로 독립적이므로 동시에 다운로드
+        # (파싱은 수 ms 수준이라 네트워크 대기만 겹치면 충분)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            kospi, kosdaq = executor.map(self._download_stock_list, ("J", "Q"))
         self._stock_cache = kospi + kosdaq
+
+        # 종목명/종목코드 정확 일치 검색용 인덱스 (중복 시 먼저 나온 항목 유지)
+        name_index, code_index = {}, {}
+        for s in self._stock_cache:
+            name_index.setdefault(s["종목명"], s)
+            code_index.setdefault(s["종목코드"], s)
+        self._name_to_stock = name_index
+        self._code_to_stock = code_index
         print(f"[종목 캐시] 총 {len(self._stock_cache)}개 종목 캐싱 완료")
 
     def get_stock_info(self, stock_name: str, start_date: str,
@@ -480,17 +647,14 @@ class KISClient:
         if not hasattr(self, "_stock_cache") or not self._stock_cache:
             return {"error": "종목 리스트가 로드되지 않았습니다."}
 
-        # 이름으로 종목코드 검색
-        matched = [s for s in self._stock_cache
-                    if s["종목명"] == stock_name]
-        if not matched:
-            # 부분 일치 검색
-            matched = [s for s in self._stock_cache
-                        if stock_name in s["종목명"]]
-        if not matched:
+        # 이름으로 종목코드 검색 (정확 일치 → 부분 일치 순)
+        stock = self._name_to_stock.get(stock_name)
+        if stock is None:
+            stock = next((s for s in self._stock_cache
+                          if stock_name in s["종목명"]), None)
+        if stock is None:
             return {"error": f"'{stock_name}' 종목을 찾을 수 없습니다."}
 
-        stock = matched[0]
         code = stock["종목코드"]
         name = stock["종목명"]
 
@@ -534,39 +698,56 @@ class KISClient:
         self.get_access_token()
         total = len(results)
         print(f"\n[재무 데이터 조회] {total}개 종목 시작...")
-        completed = [0]
-        completed_lock = threading.Lock()
 
         def _fetch_financial(item):
             code = item["종목코드"]
-            time.sleep(0.05)
             fin_data = self._get_financial_data(code)
             item["ROE"] = fin_data["ROE"]
             item["영업이익률"] = fin_data["영업이익률"]
-            with completed_lock:
-                completed[0] += 1
-                idx = completed[0]
+
+        # 진행 카운트는 결과를 받는 이 스레드에서만 갱신 (락 불필요)
+        for idx, _ in enumerate(
+                self._run_concurrently(_fetch_financial, results), 1):
             if idx % 10 == 0 or idx == total:
                 print(f"  [{idx}/{total}] 재무 데이터 조회 진행 중...")
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(_fetch_financial, item)
-                       for item in results]
-            for future in as_completed(futures):
-                future.result()  # 예외 전파
-
         print(f"[재무 데이터 조회 완료] {total}개 종목")
         return results
 
+    def _run_concurrently(self, func, items: list):
+        """items의 각 원소에 func를 병렬 적용하고 완료 순서대로 결과를 반환
+
+        모든 워커가 같은 세션(커넥션 풀)을 공유하므로
+        요청 간 연결 수립 비용 없이 네트워크 대기 시간이 겹쳐집니다.
+
+        Args:
+            func: 원소 하나를 받아 결과를 반환하는 함수
+            items: 처리할 원소 리스트
+
+        Yields:
+            func의 반환값 (완료 순서, 예외는 그대로 전파)
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = [executor.submit(func, item) for item in items]
+            for future in as_completed(futures):
+                yield future.result()
+
     def check_connection(self) -> bool:
         """API 연결 상태 확인
 
         삼성전자(005930) 주식 현재가 조회 API를 호출하여
         서버 연결이 정상인지 확인합니다.
+        CONNECTION_CHECK_TTL 이내에 성공한 적이 있으면 API를 다시 호출하지 않습니다.
 
         Returns:
             연결 정상이면 True, 실패하면 False
         """
+        if (self._last_conn_ok_at is not None and
+                time.monotonic() - self._last_conn_ok_at
+                < self.CONNECTION_CHECK_TTL):
+            return True
+        self._last_conn_ok_at = None
+
         try:
             # 주식 현재가 시세 조회 API
             url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
@@ -580,15 +761,16 @@ class KISClient:
                 "FID_INPUT_ISCD": "005930",       # 종목 코드
             }
 
-            response = requests.get(url, headers=headers, params=params)
+            response = self._api_get(url, headers, params)
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 # rt_cd "0"이면 정상 응답
                 if data.get("rt_cd") == "0":
                     name = data["output"]["stck_shrn_iscd"]
                     price = data["output"]["stck_prpr"]
                     print(f"[연결 성공] 종목: {name} / 현재가: {price}원")
+                    self._last_conn_ok_at = time.monotonic()
                     return True
 
             print(f"[연결 실패] 응답 코드: {response.status_code}")
@@ -616,9 +798,8 @@ class KISClient:
         """
         market_name = "kospi" if market_code == "J" else "kosdaq"
         filename = f"growth_{market_name}_{start_date}_{end_date}.csv"
-        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-        os.makedirs(data_dir, exist_ok=True)
-        filepath = os.path.join(data_dir, filename)
+        os.makedirs(_DATA_DIR, exist_ok=True)
+        filepath = os.path.join(_DATA_DIR, filename)
 
         df = pd.DataFrame(results)
         df.to_csv(filepath, index=False, encoding="utf-8-sig")
@@ -656,53 +837,40 @@ class KISClient:
 
         results = []
         total = len(stocks)
-        completed = [0]  # 진행 카운터 (mutable for closure)
-        results_lock = threading.Lock()
 
         def _fetch_one(stock):
+            """(결과 딕셔너리 또는 None, 진행 메시지) 반환"""
             code = stock["종목코드"]
             name = stock["종목명"]
-            time.sleep(0.05)  # 미세 지연으로 API 부하 분산
             try:
                 start_price, end_price = self._get_period_price(
                     code, start_date, end_date)
-
-                with results_lock:
-                    completed[0] += 1
-                    idx = completed[0]
-
-                if start_price is None or end_price is None:
-                    print(f"  [{idx}/{total}] {name}({code}) - 데이터 부족, 건너뜀")
-                    return None
-                elif start_price == 0:
-                    print(f"  [{idx}/{total}] {name}({code}) - 시작가 0, 건너뜀")
-                    return None
-                else:
-                    growth_rate = round(
-                        (end_price - start_price) / start_price * 100, 2)
-                    print(f"  [{idx}/{total}] {name}({code}): "
-                          f"{start_price:,} → {end_price:,} "
-                          f"({growth_rate:+.2f}%)")
-                    return {
-                        "종목코드": code,
-                        "종목명": name,
-                        "시작가": start_price,
-                        "종료가": end_price,
-                        "수익률(%)": growth_rate,
-                    }
             except Exception as e:
-                with results_lock:
-                    completed[0] += 1
-                    idx = completed[0]
-                print(f"  [{idx}/{total}] {name}({code}) - 오류: {e}")
-                return None
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(_fetch_one, s) for s in stocks]
-            for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    results.append(result)
+                return None, f"{name}({code}) - 오류: {e}"
+
+            if start_price is None or end_price is None:
+                return None, f"{name}({code}) - 데이터 부족, 건너뜀"
+            if start_price == 0:
+                return None, f"{name}({code}) - 시작가 0, 건너뜀"
+
+            growth_rate = round(
+                (end_price - start_price) / start_price * 100, 2)
+            result = {
+                "종목코드": code,
+                "종목명": name,
+                "시작가": start_price,
+                "종료가": end_price,
+                "수익률(%)": growth_rate,
+            }
+            return result, (f"{name}({code}): {start_price:,} → "
+                            f"{end_price:,} ({growth_rate:+.2f}%)")
+
+        # 진행 카운트·출력은 결과를 받는 이 스레드에서만 수행 (락 불필요)
+        for idx, (result, message) in enumerate(
+                self._run_concurrently(_fetch_one, stocks), 1):
+            print(f"  [{idx}/{total}] {message}")
+            if result is not None:
+                results.append(result)
 
         if not results:
             print("[결과 없음] 수익률을 계산할 수 있는 종목이 없습니다.")
@@ -724,10 +892,22 @@ class KISClient:
 
         return df
 
+    # get_daily_ohlcv() 응답 필드 → daily_prices 가격 컬럼
+    _DAILY_PRICE_FIELDS = {
+        "stck_oprc": "시가",
+        "stck_hgpr": "고가",
+        "stck_lwpr": "저가",
+        "stck_clpr": "종가",
+        "cntg_vol": "거래량",
+    }
+
     def get_all_stocks_daily(self, stocks: list, start_date: str,
-                             end_date: str, market: str) -> list[dict]:
+                             end_date: str, market: str) -> pd.DataFrame:
         """종목 리스트의 일별 OHLCV를 병렬 조회하여 daily_prices 형식으로 반환
 
+        가격 문자열은 종목별로 int 변환하지 않고, 수집이 끝난 뒤
+        전체 행에 대해 컬럼 단위로 한 번에 변환합니다.
+
         Args:
             stocks: [{"종목코드": ..., "종목명": ...}, ...]
             start_date: 시작일 (YYYYMMDD)
@@ -735,68 +915,54 @@ class KISClient:
             market: '코스피' 또는 '코스닥'
 
         Returns:
-            [{"날짜", "종목코드", "종목명", "시장",
-              "시가", "고가", "저가", "종가", "거래량"}, ...]
+            컬럼: 날짜, 종목코드, 종목명, 시장, 시가, 고가, 저가, 종가, 거래량
+            (DatabaseManager.save_daily_prices()에 그대로 전달 가능)
         """
         self.get_access_token()
 
-        all_records = []
-        records_lock = threading.Lock()
+        fields = list(self._DAILY_PRICE_FIELDS)
+        all_rows = []
         total = len(stocks)
-        completed = [0]
 
         def _fetch_one(stock):
+            """(원본 행 튜플 리스트, 건너뛴 사유 메시지 또는 None) 반환"""
             code = stock["종목코드"]
             name = stock["종목명"]
-            time.sleep(0.05)
             try:
+                # get_daily_ohlcv()가 종가 0인 레코드는 이미 제외
                 daily = self.get_daily_ohlcv(code, start_date, end_date)
-
-                with records_lock:
-                    completed[0] += 1
-                    idx = completed[0]
-
                 if not daily:
-                    print(f"  [{idx}/{total}] {name}({code}) - 데이터 없음, 건너뜀")
-                    return
-
-                records = [
-                    {
-                        "날짜": r["stck_bsop_date"],
-                        "종목코드": code,
-                        "종목명": name,
-                        "시장": market,
-                        "시가": int(r.get("stck_oprc", 0) or 0),
-                        "고가": int(r.get("stck_hgpr", 0) or 0),
-                        "저가": int(r.get("stck_lwpr", 0) or 0),
-                        "종가": int(r.get("stck_clpr", 0) or 0),
-                        "거래량": int(r.get("cntg_vol", 0) or 0),
-                    }
+                    return [], f"{name}({code}) - 데이터 없음, 건너뜀"
+
+                rows = [
+                    (r["stck_bsop_date"], code, name,
+                     *[r.get(f) for f in fields])
                     for r in daily
-                    if int(r.get("stck_clpr", 0) or 0) > 0
                 ]
-
-                if records:
-                    with records_lock:
-                        all_records.extend(records)
-                    if idx % 200 == 0 or idx == total:
-                        print(f"  [{idx}/{total}] 진행 중...")
-                else:
-                    print(f"  [{idx}/{total}] {name}({code}) - 유효 데이터 없음")
+                return rows, None
 
             except Exception as e:
-                with records_lock:
-                    completed[0] += 1
-                    idx = completed[0]
-                print(f"  [{idx}/{total}] {name}({code}) - 오류: {e}")
+                return [], f"{name}({code}) - 오류: {e}"
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(_fetch_one, s) for s in stocks]
-            for future in as_completed(futures):
-                future.result()
-
-        print(f"[일별 데이터 수집 완료] {len(all_records)}건 ({market})")
-        return all_records
+        # 결과 취합·진행 출력은 결과를 받는 이 스레드에서만 수행 (락 불필요)
+        for idx, (rows, message) in enumerate(
+                self._run_concurrently(_fetch_one, stocks), 1):
+            if message is not None:
+                print(f"  [{idx}/{total}] {message}")
+                continue
+            all_rows.extend(rows)
+            if idx % 200 == 0 or idx == total:
+                print(f"  [{idx}/{total}] 진행 중...")
+
+        df = pd.DataFrame(all_rows, columns=["날짜", "종목코드", "종목명", *fields])
+        df.insert(3, "시장", market)
+        # 빈 문자열/None은 0으로 (기존 int(x or 0)과 동일)
+        for field, col in self._DAILY_PRICE_FIELDS.items():
+            df[col] = (pd.to_numeric(df.pop(field), errors="coerce")
+                       .fillna(0).astype("int64"))
+
+        print(f"[일별 데이터 수집 완료] {len(df)}건 ({market})")
+        return df
 
 
 # === 사용 예시 ===
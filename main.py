@@ -16,39 +16,80 @@ Discord 봇 — Stock Scanner
 
 import asyncio
 import datetime
-import glob
+import io
+import itertools
 import os
-from typing import Optional
+import re
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
 
 import discord
 import pandas as pd
 import pytz
 from discord import app_commands
 from discord.ext import tasks
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 
 import config
 from db import DatabaseManager
 from kis_client import KISClient
 from analysis_engine import (
     fetch_minute_ohlcv, check_golden_cross,
-    fetch_naver_news, generate_signal_chart,
+    fetch_naver_news_batch, render_charts_batch, create_chart_pool,
 )
 
 KST = pytz.timezone("Asia/Seoul")
 PLATFORM = 'discord'  # 이 봇의 플랫폼 식별자
 
+
+class _Admission:
+    """동시에 실행할 작업 수를 제한하는 비대기 입장 제어.
+
+    이벤트 루프 스레드에서만 사용합니다. try_acquire()는 await 없이
+    확인과 점유를 한 번에 하므로, 확인 후 점유 전에 다른 명령이
+    끼어들어 둘 다 통과하는 일이 없습니다.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._active = 0
+
+    def try_acquire(self) -> bool:
+        """자리가 있으면 점유하고 True, 가득 찼으면 False."""
+        if self._active >= self._limit:
+            return False
+        self._active += 1
+        return True
+
+    def release(self):
+        self._active -= 1
+
+
 # KIS API 동시 호출 방지 — 한 번에 1개 작업만 허용
-_kis_lock = asyncio.Semaphore(1)
+_kis_admission = _Admission(1)
+# 관심종목 스캔 시 동시에 분봉을 조회할 종목 수
+# (실제 호출 속도는 KISClient의 rate limiter가 제한)
+SCAN_CONCURRENCY = 5
+# 봇 수명 동안 유지하는 차트 렌더링 프로세스 수
+CHART_WORKERS = 2
 
 
 # ── 유틸리티 ──────────────────────────────────────────────
 
+_DATE_RE = re.compile(r"([0-9]{4})([0-9]{2})([0-9]{2})")
+
+
 def validate_date(date_str: str) -> Optional[str]:
     """8자리 날짜 문자열 검증. 유효하면 그대로, 아니면 None."""
-    if not date_str or len(date_str) != 8 or not date_str.isdigit():
+    m = _DATE_RE.fullmatch(date_str or "")
+    if not m:
         return None
     try:
-        datetime.datetime.strptime(date_str, "%Y%m%d")
+        # 월/일 범위와 윤년은 date 생성자가 검증
+        datetime.date(int(m[1]), int(m[2]), int(m[3]))
         return date_str
     except ValueError:
         return None
@@ -59,27 +100,42 @@ def _find_stock(client: KISClient, query: str) -> Optional[dict]:
     if not hasattr(client, "_stock_cache") or not client._stock_cache:
         return None
     if len(query) == 6 and query.isdigit():
-        for s in client._stock_cache:
-            if s["종목코드"] == query:
-                return {"종목코드": s["종목코드"], "종목명": s["종목명"]}
+        s = client._code_to_stock.get(query)
+    else:
+        # 정확 일치는 load_stock_list()가 만든 인덱스로, 없으면 부분 일치 검색
+        s = client._name_to_stock.get(query)
+        if s is None:
+            s = next((s for s in client._stock_cache
+                      if query in s["종목명"]), None)
+    if s is None:
         return None
-    for s in client._stock_cache:
-        if s["종목명"] == query:
-            return {"종목코드": s["종목코드"], "종목명": s["종목명"]}
-    for s in client._stock_cache:
-        if query in s["종목명"]:
-            return {"종목코드": s["종목코드"], "종목명": s["종목명"]}
-    return None
+    return {"종목코드": s["종목코드"], "종목명": s["종목명"]}
 
 
 def get_latest_data_file(exclude_file: str = None) -> Optional[str]:
-    """data/ 폴더에서 가장 최근 통합 분석 CSV 파일 찾기."""
-    pattern = os.path.join(config.DATA_DIR, "growth_combined_*.csv")
-    files = sorted(glob.glob(pattern))
+    """data/ 폴더에서 가장 최근 통합 분석 CSV 파일 찾기.
+
+    파일명(growth_combined_시작일_종료일.csv)의 사전순 최댓값을 한 번의
+    디렉토리 순회로 찾습니다.
+    """
     if exclude_file:
         exclude_file = os.path.abspath(exclude_file)
-        files = [f for f in files if os.path.abspath(f) != exclude_file]
-    return files[-1] if files else None
+    latest = None
+    try:
+        with os.scandir(config.DATA_DIR) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("growth_combined_")
+                        and name.endswith(".csv")):
+                    continue
+                if latest is not None and name <= latest.name:
+                    continue
+                if exclude_file and os.path.abspath(entry.path) == exclude_file:
+                    continue
+                latest = entry
+    except FileNotFoundError:
+        return None
+    return latest.path if latest else None
 
 
 def find_reentry_stocks(prev_df: pd.DataFrame,
@@ -90,38 +146,28 @@ def find_reentry_stocks(prev_df: pd.DataFrame,
     if len(prev_df) < lower:
         return pd.DataFrame()
 
-    prev_bottom = prev_df.iloc[lower - 1:upper].copy()
-    prev_bottom["이전_순위"] = range(lower, lower + len(prev_bottom))
-
-    curr_df = curr_df.copy()
-    curr_df["현재_순위"] = range(1, len(curr_df) + 1)
-
-    reentry_codes = set(prev_bottom["종목코드"]) & set(curr_df["종목코드"])
-    if not reentry_codes:
+    # 필요한 컬럼만 골라 순위를 붙임 (원본 DataFrame 전체 복사 없이)
+    prev_bottom = prev_df.iloc[lower - 1:upper]
+    prev_part = prev_bottom[["종목코드"]].assign(**{
+        "이전_순위": range(lower, lower + len(prev_bottom)),
+        "이전_수익률(%)": prev_bottom["수익률(%)"],
+    })
+
+    # 종목코드 기준 해시 조인 한 번으로 재진입 종목 추출
+    # (중복 코드는 기존과 같이 각 표에서 처음 나온 행 사용)
+    optional_cols = [c for c in ("ROE", "영업이익률") if c in curr_df.columns]
+    curr_part = curr_df[["종목코드", "종목명"]].assign(**{
+        "현재_순위": range(1, len(curr_df) + 1),
+        "현재_수익률(%)": curr_df["수익률(%)"],
+    }).join(curr_df[optional_cols])
+    result = prev_part.drop_duplicates("종목코드").merge(
+        curr_part.drop_duplicates("종목코드"), on="종목코드")
+    if result.empty:
         return pd.DataFrame()
 
-    rows = []
-    for code in reentry_codes:
-        prev_row = prev_bottom[prev_bottom["종목코드"] == code].iloc[0]
-        curr_row = curr_df[curr_df["종목코드"] == code].iloc[0]
-        row = {
-            "종목코드": code,
-            "종목명": curr_row["종목명"],
-            "이전_순위": int(prev_row["이전_순위"]),
-            "이전_수익률(%)": prev_row["수익률(%)"],
-            "현재_순위": int(curr_row["현재_순위"]),
-            "현재_수익률(%)": curr_row["수익률(%)"],
-        }
-        if "ROE" in curr_row:
-            row["ROE"] = curr_row["ROE"]
-        if "영업이익률" in curr_row:
-            row["영업이익률"] = curr_row["영업이익률"]
-        rows.append(row)
-
-    result = pd.DataFrame(rows)
-    result.sort_values("현재_순위", inplace=True)
-    result.reset_index(drop=True, inplace=True)
-    return result
+    result = result[["종목코드", "종목명", "이전_순위", "이전_수익률(%)",
+                     "현재_순위", "현재_수익률(%)", *optional_cols]]
+    return result.sort_values("현재_순위", ignore_index=True)
 
 
 def _save_combined_csv(results: list[dict],
@@ -134,43 +180,95 @@ def _save_combined_csv(results: list[dict],
     return filepath
 
 
+_EXCEL_HEADER_FONT = Font(bold=True)
+_EXCEL_HEADER_BORDER = Border(*(Side(style="thin"),) * 4)
+_EXCEL_HEADER_ALIGN = Alignment(horizontal="center", vertical="top")
+
+
+def _write_sheet(wb: Workbook, sheet: str, df: pd.DataFrame) -> None:
+    """write-only 워크북에 DataFrame을 시트 하나로 기록 (헤더 + 행 스트리밍)."""
+    ws = wb.create_sheet(sheet)
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=col)
+        cell.font = _EXCEL_HEADER_FONT
+        cell.border = _EXCEL_HEADER_BORDER
+        cell.alignment = _EXCEL_HEADER_ALIGN
+        header.append(cell)
+    ws.append(header)
+    # 컬럼 단위로 파이썬 리스트를 만든 뒤 zip으로 행을 구성
+    # (NaN은 빈 셀로 기록 — to_excel과 동일, 결측이 있는 컬럼만 변환)
+    columns = [s.astype(object).where(s.notna(), None).tolist()
+               if s.hasnans else s.tolist()
+               for _, s in df.items()]
+    for row in zip(*columns):
+        ws.append(row)
+
+
 def create_excel_report(combined_df: pd.DataFrame, kospi_df: pd.DataFrame,
                         kosdaq_df: pd.DataFrame, reentry_df: pd.DataFrame,
                         start_date: str, end_date: str,
-                        watchlist_df: pd.DataFrame = None) -> str:
+                        watchlist_df: pd.DataFrame = None,
+                        as_bytes: bool = False):
+    """분석 결과를 엑셀 리포트로 저장.
+
+    Args:
+        as_bytes: True면 저장 경로와 함께 파일 내용(bytes)도 반환
+                  (디스코드 업로드 시 파일을 다시 읽지 않도록)
+
+    Returns:
+        저장 경로, as_bytes=True면 (저장 경로, 파일 내용)
+    """
     os.makedirs(config.DATA_DIR, exist_ok=True)
     filepath = os.path.join(config.DATA_DIR,
                             f"report_{start_date}_{end_date}.xlsx")
     display_cols = ["종목코드", "종목명", "시작가", "종료가", "수익률(%)",
                     "ROE", "영업이익률"]
 
-    with pd.ExcelWriter(filepath, engine="openpyxl") as writer:
-        for df, sheet in [(combined_df, "통합_TOP100"),
-                          (kospi_df, "코스피_TOP100"),
-                          (kosdaq_df, "코스닥_TOP100")]:
-            cols = [c for c in display_cols if c in df.columns]
-            df[cols].to_excel(writer, sheet_name=sheet, index=False)
-
-        if reentry_df.empty:
-            pd.DataFrame({"메시지": ["해당 없음"]}).to_excel(
-                writer, sheet_name="재진입_포착", index=False)
+    # 셀 객체 그래프를 만들지 않고 행을 바로 스트리밍하는 write-only 모드
+    wb = Workbook(write_only=True)
+    for df, sheet in [(combined_df, "통합_TOP100"),
+                      (kospi_df, "코스피_TOP100"),
+                      (kosdaq_df, "코스닥_TOP100")]:
+        cols = [c for c in display_cols if c in df.columns]
+        _write_sheet(wb, sheet, df[cols])
+
+    if reentry_df.empty:
+        _write_sheet(wb, "재진입_포착", pd.DataFrame({"메시지": ["해당 없음"]}))
+    else:
+        _write_sheet(wb, "재진입_포착", reentry_df)
+
+    if watchlist_df is not None:
+        if not watchlist_df.empty:
+            cols = [c for c in display_cols if c in watchlist_df.columns]
+            _write_sheet(wb, "관심종목", watchlist_df[cols])
         else:
-            reentry_df.to_excel(writer, sheet_name="재진입_포착", index=False)
-
-        if watchlist_df is not None:
-            if not watchlist_df.empty:
-                cols = [c for c in display_cols if c in watchlist_df.columns]
-                watchlist_df[cols].to_excel(
-                    writer, sheet_name="관심종목", index=False)
-            else:
-                pd.DataFrame({"메시지": ["등록된 관심종목이 없거나 "
-                                        "해당 기간 데이터가 없습니다"]}).to_excel(
-                    writer, sheet_name="관심종목", index=False)
-
+            _write_sheet(wb, "관심종목", pd.DataFrame(
+                {"메시지": ["등록된 관심종목이 없거나 "
+                          "해당 기간 데이터가 없습니다"]}))
+
+    # 메모리에서 한 번 직렬화한 뒤 같은 bytes를 디스크 저장과 업로드에 재사용
+    bio = io.BytesIO()
+    wb.save(bio)
+    data = bio.getvalue()
+    with open(filepath, "wb") as f:
+        f.write(data)
     print(f"[엑셀 저장] {filepath}")
+    if as_bytes:
+        return filepath, data
     return filepath
 
 
+def _top3_lines(df: pd.DataFrame) -> list[str]:
+    """상위 3개 종목을 '순위. 종목명 (+수익률%)' 줄로 변환 (빈 DataFrame은 빈 리스트)."""
+    if df.empty:
+        return []
+    top3 = df.head(3)
+    return [f"{i}. {name} (+{rate:.2f}%)"
+            for i, (name, rate) in enumerate(
+                zip(top3["종목명"], top3["수익률(%)"]), 1)]
+
+
 def build_analysis_message(kospi_df: pd.DataFrame, kosdaq_df: pd.DataFrame,
                            reentry_df: pd.DataFrame,
                            start_date: str, end_date: str) -> str:
@@ -180,11 +278,9 @@ def build_analysis_message(kospi_df: pd.DataFrame, kosdaq_df: pd.DataFrame,
         "",
         "\U0001F3C6 코스피 TOP 3:",
     ]
-    for i, (_, row) in enumerate(kospi_df.head(3).iterrows(), 1):
-        lines.append(f"{i}. {row['종목명']} (+{row['수익률(%)']:.2f}%)")
+    lines += _top3_lines(kospi_df)
     lines += ["", "\U0001F3C6 코스닥 TOP 3:"]
-    for i, (_, row) in enumerate(kosdaq_df.head(3).iterrows(), 1):
-        lines.append(f"{i}. {row['종목명']} (+{row['수익률(%)']:.2f}%)")
+    lines += _top3_lines(kosdaq_df)
     lines += [
         "",
         f"\U0001F504 재진입 종목: {len(reentry_df) if not reentry_df.empty else 0}개",
@@ -238,16 +334,19 @@ def run_collection(client: KISClient, db: DatabaseManager,
     kosdaq_top = db.get_prices(start_date, end_date, market="코스닥", top_n=config.TOP_N)
     combined_top = db.get_prices(start_date, end_date, top_n=config.TOP_N)
 
-    seen: set = set()
-    unique_for_fin: list = []
-    for records in [kospi_top, kosdaq_top, combined_top]:
-        for r in records:
-            if r["종목코드"] not in seen:
-                seen.add(r["종목코드"])
-                unique_for_fin.append(r)
-
-    print(f"  → 고유 종목 {len(unique_for_fin):,}개")
-    financial_results = client.add_financial_data(unique_for_fin)
+    # 종목코드 기준 중복 제거 (처음 나온 순서와 레코드 유지)
+    unique_by_code: dict = {}
+    for r in itertools.chain(kospi_top, kosdaq_top, combined_top):
+        unique_by_code.setdefault(r["종목코드"], r)
+    unique_for_fin = list(unique_by_code.values())
+
+    # 오늘 이미 갱신된 재무 데이터는 다시 조회하지 않음 (분기 단위로만 변동)
+    fresh_codes = db.get_fresh_financial_codes(
+        list(unique_by_code), datetime.date.today().isoformat())
+    need_fin = [r for r in unique_for_fin if r["종목코드"] not in fresh_codes]
+    print(f"  → 고유 종목 {len(unique_for_fin):,}개 중 "
+          f"{len(need_fin):,}개 조회 (오늘 갱신됨 {len(fresh_codes):,}개 생략)")
+    financial_results = client.add_financial_data(need_fin)
     db.save_financials(financial_results)
     fin_count = len(financial_results)
 
@@ -260,11 +359,13 @@ def run_analysis_from_db(db: DatabaseManager,
                          user_id: int = None) -> tuple:
     print(f"\n[분석 시작] {start_date} ~ {end_date} (DB 조회)")
 
-    kospi_records = db.get_prices(start_date, end_date,
-                                  market="코스피", top_n=config.TOP_N)
-    kosdaq_records = db.get_prices(start_date, end_date,
-                                   market="코스닥", top_n=config.TOP_N)
-    combined_records = db.get_prices(start_date, end_date, top_n=config.TOP_N)
+    # TOP N 조회와 재무 데이터 결합을 DB 쿼리 한 번으로 처리
+    kospi_records = db.get_prices_with_financials(
+        start_date, end_date, market="코스피", top_n=config.TOP_N)
+    kosdaq_records = db.get_prices_with_financials(
+        start_date, end_date, market="코스닥", top_n=config.TOP_N)
+    combined_records = db.get_prices_with_financials(
+        start_date, end_date, top_n=config.TOP_N)
 
     kospi_top100 = pd.DataFrame(kospi_records)
     kosdaq_top100 = pd.DataFrame(kosdaq_records)
@@ -273,37 +374,16 @@ def run_analysis_from_db(db: DatabaseManager,
     if combined_top100.empty:
         raise ValueError("분석 결과가 없습니다.")
 
-    all_codes = set()
-    for df in [kospi_top100, kosdaq_top100, combined_top100]:
-        if not df.empty:
-            all_codes.update(df["종목코드"].tolist())
-
     watchlist_df = pd.DataFrame()
     if user_id is not None:
         wl_items = db.get_watchlist(user_id, platform=PLATFORM)
         if wl_items:
+            # 관심종목 수익률과 재무 데이터도 쿼리 한 번으로 조회
             wl_codes = [i["종목코드"] for i in wl_items]
-            wl_records = db.get_prices_by_codes(start_date, end_date, wl_codes)
+            wl_records = db.get_prices_by_codes_with_financials(
+                start_date, end_date, wl_codes)
             if wl_records:
                 watchlist_df = pd.DataFrame(wl_records)
-                all_codes.update(watchlist_df["종목코드"].tolist())
-
-    financial_map = db.get_financials(list(all_codes))
-
-    def merge_financial(df: pd.DataFrame) -> pd.DataFrame:
-        if df.empty:
-            return df
-        df = df.copy()
-        df["ROE"] = df["종목코드"].map(
-            lambda c: financial_map.get(c, {}).get("ROE"))
-        df["영업이익률"] = df["종목코드"].map(
-            lambda c: financial_map.get(c, {}).get("영업이익률"))
-        return df
-
-    kospi_top100 = merge_financial(kospi_top100)
-    kosdaq_top100 = merge_financial(kosdaq_top100)
-    combined_top100 = merge_financial(combined_top100)
-    watchlist_df = merge_financial(watchlist_df)
 
     for df in [kospi_top100, kosdaq_top100, combined_top100, watchlist_df]:
         if not df.empty:
@@ -315,15 +395,19 @@ def run_analysis_from_db(db: DatabaseManager,
     prev_file = get_latest_data_file(exclude_file=csv_path)
     reentry_df = pd.DataFrame()
     if prev_file:
-        prev_df = pd.read_csv(prev_file, dtype={"종목코드": str})
+        # find_reentry_stocks()가 쓰는 두 컬럼만 파싱
+        prev_df = pd.read_csv(prev_file, usecols=["종목코드", "수익률(%)"],
+                              dtype={"종목코드": str})
         reentry_df = find_reentry_stocks(prev_df, combined_top100)
 
-    excel_path = create_excel_report(
+    excel_path, excel_bytes = create_excel_report(
         combined_top100, kospi_top100, kosdaq_top100,
         reentry_df, start_date, end_date,
-        watchlist_df=watchlist_df if user_id is not None else None)
+        watchlist_df=watchlist_df if user_id is not None else None,
+        as_bytes=True)
 
-    return kospi_top100, kosdaq_top100, combined_top100, reentry_df, excel_path
+    return (kospi_top100, kosdaq_top100, combined_top100, reentry_df,
+            excel_path, excel_bytes)
 
 
 # ── Discord 봇 ────────────────────────────────────────────
@@ -335,20 +419,58 @@ def _check_allowed(interaction: discord.Interaction) -> bool:
 
 
 async def _scan_and_send(kis: KISClient, channel: discord.TextChannel,
-                         user_id: int, stocks: list[dict]):
-    """한 사용자의 관심종목을 스캔하여 채널에 결과 전송."""
-    signals_found = 0
-    for stock in stocks:
+                         user_id: int, stocks: list[dict],
+                         ohlcv_cache: Optional[dict] = None,
+                         render_charts: Optional[Callable] = None):
+    """한 사용자의 관심종목을 스캔하여 채널에 결과 전송.
+
+    ohlcv_cache({종목코드: 분봉 DataFrame})를 넘기면 같은 스캔 회차에서
+    이미 조회한 종목은 API를 다시 호출하지 않고 재사용합니다
+    (조회 실패로 빈 결과가 나온 종목은 저장하지 않음).
+    render_charts(jobs → 차트 경로 리스트)를 넘기면 그 함수로 차트를 생성합니다
+    (기본: 호출마다 풀을 만드는 render_charts_batch).
+    """
+    # 1) 종목별 분봉 수집 + 신호 판단 (최대 SCAN_CONCURRENCY개 종목 동시 조회)
+    sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def _check_stock(stock: dict) -> Optional[tuple]:
         code, name = stock["종목코드"], stock["종목명"]
         try:
-            df = await asyncio.to_thread(fetch_minute_ohlcv, kis, code)
+            df = ohlcv_cache.get(code) if ohlcv_cache is not None else None
+            if df is None:
+                async with sem:
+                    df = await asyncio.to_thread(fetch_minute_ohlcv, kis, code)
+                # 조회 실패(빈 DataFrame)는 저장하지 않아 다른 사용자가 재조회
+                if ohlcv_cache is not None and not df.empty:
+                    ohlcv_cache[code] = df
             if df.empty:
-                continue
+                return None
             result = check_golden_cross(df)
-            if not result["signal"]:
-                continue
+            if result["signal"]:
+                return (code, name, df, result)
+        except Exception as e:
+            print(f"[스캔 오류] {name}({code}): {e}")
+        return None
+
+    # gather는 입력 순서대로 결과를 돌려주므로 전송 순서는 관심종목 순서 유지
+    checked = await asyncio.gather(*(_check_stock(s) for s in stocks))
+    signals = [sig for sig in checked if sig is not None]
 
-            signals_found += 1
+    # 2) 신호 종목 뉴스를 한 번에 병렬 검색
+    news_map = {}
+    if signals:
+        news_map = await asyncio.to_thread(
+            fetch_naver_news_batch, [name for _, name, _, _ in signals])
+
+    # 3) 신호 차트를 프로세스 풀에서 일괄 생성
+    chart_paths = await asyncio.to_thread(
+        render_charts or render_charts_batch,
+        [(df, name, result["datetime"]) for _, name, df, result in signals])
+
+    # 4) 결과 전송
+    for (code, name, _, result), chart_path in zip(signals, chart_paths):
+        chart = None
+        try:
             lines = [
                 f"<@{user_id}> \U0001F6A8 **골든크로스 신호**: {name}({code})",
                 f"\U0001F552 시각: {result['datetime']}",
@@ -356,29 +478,35 @@ async def _scan_and_send(kis: KISClient, channel: discord.TextChannel,
                 f"MA3: {result['ma3']:,.2f}원 | MA5: {result['ma5']:,.2f}원",
                 f"\U0001F4A1 {result['reason']}",
             ]
-            news = await asyncio.to_thread(fetch_naver_news, name)
+            news = news_map.get(name)
             if news:
                 lines.append("\n\U0001F4F0 관련 뉴스:")
                 for n in news:
                     lines.append(f"  • {n['title']}\n    <{n['link']}>")
-            await channel.send("\n".join(lines))
 
-            try:
-                chart_path = await asyncio.to_thread(
-                    generate_signal_chart, df, name, result["datetime"])
-                if chart_path:
-                    with open(chart_path, "rb") as f:
-                        await channel.send(file=discord.File(f))
-                    os.unlink(chart_path)
-            except Exception as e:
-                print(f"[차트 오류] {name}: {e}")
+            # 신호 설명과 차트를 메시지 한 번으로 전송 (차트가 없으면 텍스트만)
+            if chart_path:
+                try:
+                    chart = discord.File(chart_path)
+                except OSError as e:
+                    print(f"[차트 오류] {name}: {e}")
+            await channel.send("\n".join(lines), file=chart)
 
         except Exception as e:
             print(f"[스캔 오류] {name}({code}): {e}")
+        finally:
+            # 전송 성공 여부와 관계없이 임시 차트 파일 정리
+            if chart is not None:
+                chart.close()
+            if chart_path:
+                try:
+                    os.unlink(chart_path)
+                except FileNotFoundError:
+                    pass
 
     await channel.send(
         f"<@{user_id}> 스캔 완료 — "
-        f"{len(stocks)}개 종목 중 {signals_found}개 신호 감지")
+        f"{len(stocks)}개 종목 중 {len(signals)}개 신호 감지")
 
 
 class StockScannerBot(discord.Client):
@@ -388,6 +516,44 @@ class StockScannerBot(discord.Client):
         self.tree = app_commands.CommandTree(self)
         self.db = db
         self.kis = kis
+        # 스캔마다 워커를 새로 띄우지 않도록 차트 프로세스 풀을 봇과 함께 유지
+        # (워커는 첫 차트 요청 때 생성됨)
+        self.chart_pool = create_chart_pool(CHART_WORKERS)
+        # to_thread 워커 여러 개가 동시에 풀을 교체하지 않도록 보호
+        self._chart_pool_lock = threading.Lock()
+
+    async def close(self):
+        self.chart_pool.shutdown(wait=False, cancel_futures=True)
+        await super().close()
+
+    def _replace_chart_pool(self, broken):
+        """깨진 차트 풀을 새 풀로 교체하고 현재 풀을 반환
+
+        다른 스캔이 이미 교체했으면 그 풀을 그대로 반환합니다.
+        """
+        with self._chart_pool_lock:
+            if self.chart_pool is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.chart_pool = create_chart_pool(CHART_WORKERS)
+            return self.chart_pool
+
+    def render_charts(self, jobs: list[tuple]) -> list[str]:
+        """봇의 차트 풀로 render_charts_batch() 실행 (작업 스레드에서 호출)
+
+        워커가 비정상 종료(OOM 등)되어 풀이 깨지면 새 풀로 교체해 한 번
+        재시도합니다. 재시도도 실패하면 모든 항목을 빈 문자열로 반환합니다.
+        """
+        pool = self.chart_pool
+        try:
+            return render_charts_batch(jobs, executor=pool)
+        except BrokenProcessPool:
+            print("[차트 풀 재생성] 워커 비정상 종료로 프로세스 풀을 새로 만듭니다")
+            pool = self._replace_chart_pool(pool)
+        try:
+            return render_charts_batch(jobs, executor=pool)
+        except BrokenProcessPool as e:
+            print(f"[차트 일괄 생성 오류] {e}")
+            return [""] * len(jobs)
 
     async def setup_hook(self):
         # 테스트 서버 ID가 있으면 즉시 반영, 없으면 글로벌 동기화(최대 1시간)
@@ -419,16 +585,20 @@ class StockScannerBot(discord.Client):
             print(f"[자동 스캔] 채널 {config.DISCORD_CHANNEL_ID}을 찾을 수 없습니다.")
             return
 
-        grouped = self.db.get_all_watchlist_grouped()
+        grouped = await self.db.aget_all_watchlist_grouped()
         discord_grouped = grouped.get(PLATFORM, {})
         if not discord_grouped:
             print("[자동 스캔] 등록된 관심종목이 없습니다.")
             return
 
         print(f"[자동 스캔] {len(discord_grouped)}명 스캔 시작")
+        # 여러 사용자가 같은 종목을 담은 경우 이번 회차에서는 분봉을 한 번만 조회
+        ohlcv_cache = {}
         for user_id, stocks in discord_grouped.items():
             try:
-                await _scan_and_send(self.kis, channel, user_id, stocks)
+                await _scan_and_send(self.kis, channel, user_id, stocks,
+                                     ohlcv_cache=ohlcv_cache,
+                                     render_charts=self.render_charts)
             except Exception as e:
                 print(f"[자동 스캔 오류] user_id={user_id}: {e}")
         print("[자동 스캔] 완료")
@@ -478,23 +648,24 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
                 ephemeral=True)
             return
 
-        if _kis_lock.locked():
+        if not _kis_admission.try_acquire():
             await interaction.response.send_message(
                 "\U000023F3 현재 다른 수집 작업이 진행 중입니다. 잠시 후 다시 시도해주세요.",
                 ephemeral=True)
             return
 
-        await interaction.response.defer()
-        async with _kis_lock:
-            try:
-                price_count, fin_count = await asyncio.to_thread(
-                    run_collection, bot.kis, bot.db, start_date, end_date)
-                await interaction.followup.send(
-                    f"수집 완료!\n"
-                    f"\U0001F4C5 기간: {start_date} ~ {end_date}\n"
-                    f"가격 {price_count:,}건, 재무 {fin_count:,}건 저장됨")
-            except Exception as e:
-                await interaction.followup.send(f"수집 중 오류가 발생했습니다: {e}")
+        try:
+            await interaction.response.defer()
+            price_count, fin_count = await asyncio.to_thread(
+                run_collection, bot.kis, bot.db, start_date, end_date)
+            await interaction.followup.send(
+                f"수집 완료!\n"
+                f"\U0001F4C5 기간: {start_date} ~ {end_date}\n"
+                f"가격 {price_count:,}건, 재무 {fin_count:,}건 저장됨")
+        except Exception as e:
+            await interaction.followup.send(f"수집 중 오류가 발생했습니다: {e}")
+        finally:
+            _kis_admission.release()
 
     # ── /analyze ───────────────────────────────────────────
 
@@ -510,25 +681,28 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
             await interaction.response.send_message(
                 "날짜를 YYYYMMDD 형태로 입력해주세요.", ephemeral=True)
             return
-        if not bot.db.has_data(start_date, end_date):
-            await interaction.response.send_message(
+        # DB 조회가 길어져도 3초 응답 제한에 걸리지 않도록 먼저 defer
+        await interaction.response.defer()
+        if not await bot.db.ahas_data(start_date, end_date):
+            await interaction.followup.send(
                 f"데이터가 없습니다. 먼저 수집을 진행해주세요.\n"
                 f"`/collect {start_date} {end_date}`")
             return
 
-        await interaction.response.defer()
         try:
-            kospi_top100, kosdaq_top100, _, reentry_df, excel_path = (
+            (kospi_top100, kosdaq_top100, _, reentry_df,
+             excel_path, excel_bytes) = (
                 await asyncio.to_thread(
                     run_analysis_from_db, bot.db, start_date, end_date,
                     interaction.user.id)
             )
             message = build_analysis_message(
                 kospi_top100, kosdaq_top100, reentry_df, start_date, end_date)
-            with open(excel_path, "rb") as f:
-                await interaction.followup.send(
-                    content=message,
-                    file=discord.File(f, filename=os.path.basename(excel_path)))
+            # 작업 스레드에서 만든 bytes를 그대로 업로드 (이벤트 루프에서 디스크 읽기 없음)
+            await interaction.followup.send(
+                content=message,
+                file=discord.File(io.BytesIO(excel_bytes),
+                                  filename=os.path.basename(excel_path)))
         except Exception as e:
             await interaction.followup.send(f"분석 중 오류가 발생했습니다: {e}")
 
@@ -585,14 +759,16 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
             await interaction.response.send_message(
                 f"'{stock}' 종목을 찾을 수 없습니다.", ephemeral=True)
             return
-        added = bot.db.add_watchlist(
+        # 수집 중에는 쓰기가 lock을 기다릴 수 있으므로 먼저 defer
+        await interaction.response.defer()
+        added = await bot.db.aadd_watchlist(
             interaction.user.id, found["종목코드"], found["종목명"],
             platform=PLATFORM)
         if added:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{found['종목명']}({found['종목코드']}) 관심종목에 추가했습니다.")
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{found['종목명']}({found['종목코드']})은(는) 이미 등록된 종목입니다.")
 
     # ── /watch_remove ──────────────────────────────────────
@@ -608,13 +784,15 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
             await interaction.response.send_message(
                 f"'{stock}' 종목을 찾을 수 없습니다.", ephemeral=True)
             return
-        removed = bot.db.remove_watchlist(
+        # 수집 중에는 쓰기가 lock을 기다릴 수 있으므로 먼저 defer
+        await interaction.response.defer()
+        removed = await bot.db.aremove_watchlist(
             interaction.user.id, found["종목코드"], platform=PLATFORM)
         if removed:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{found['종목명']}({found['종목코드']}) 관심종목에서 삭제했습니다.")
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"{found['종목명']}({found['종목코드']})은(는) "
                 f"관심종목에 등록되어 있지 않습니다.")
 
@@ -625,9 +803,10 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
         if not _check_allowed(interaction):
             await interaction.response.send_message("권한이 없습니다.", ephemeral=True)
             return
-        items = bot.db.get_watchlist(interaction.user.id, platform=PLATFORM)
+        await interaction.response.defer(ephemeral=True)
+        items = await bot.db.aget_watchlist(interaction.user.id, platform=PLATFORM)
         if not items:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "등록된 관심종목이 없습니다.\n`/watch_add 종목명` 으로 추가하세요.",
                 ephemeral=True)
             return
@@ -635,8 +814,7 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
         for i, item in enumerate(items, 1):
             lines.append(
                 f"{i}. {item['종목명']}({item['종목코드']}) - {item['등록일']}")
-        await interaction.response.send_message(
-            "\n".join(lines), ephemeral=True)
+        await interaction.followup.send("\n".join(lines), ephemeral=True)
 
     # ── /scan ──────────────────────────────────────────────
 
@@ -646,25 +824,28 @@ def create_bot(db: DatabaseManager, kis: KISClient) -> StockScannerBot:
         if not _check_allowed(interaction):
             await interaction.response.send_message("권한이 없습니다.", ephemeral=True)
             return
-        stocks = bot.db.get_watchlist(interaction.user.id, platform=PLATFORM)
+        stocks = await bot.db.aget_watchlist(interaction.user.id, platform=PLATFORM)
         if not stocks:
             await interaction.response.send_message(
                 "등록된 관심종목이 없습니다.\n`/watch_add 종목명` 으로 추가하세요.",
                 ephemeral=True)
             return
 
-        if _kis_lock.locked():
+        if not _kis_admission.try_acquire():
             await interaction.response.send_message(
                 "\U000023F3 현재 다른 작업이 진행 중입니다. 잠시 후 다시 시도해주세요.",
                 ephemeral=True)
             return
 
-        await interaction.response.defer()
-        async with _kis_lock:
+        try:
+            await interaction.response.defer()
             await interaction.followup.send(
                 f"관심종목 {len(stocks)}개를 스캔합니다. 잠시만 기다려주세요...")
             await _scan_and_send(bot.kis, interaction.channel,
-                                 interaction.user.id, stocks)
+                                 interaction.user.id, stocks,
+                                 render_charts=bot.render_charts)
+        finally:
+            _kis_admission.release()
 
     return bot
 